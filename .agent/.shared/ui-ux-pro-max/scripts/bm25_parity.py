@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max BM25 Parity - checks that NumpyBM25 ranks exactly like BM25
+Usage: python bm25_parity.py [--docs 2000] [--queries 200] [--seed 42]
+
+Both scorers are run on a generated corpus of at least NUMPY_MIN_DOCS rows and
+on every CSV_CONFIG and STACK_CONFIG data file. For each query and top_k (None
+included) BM25.score() and NumpyBM25.from_state(state).score() must return the
+same (doc_idx, score) list. Exits 1 if any corpus has a mismatch.
+"""
+
+import argparse
+import random
+import sys
+
+from core import (
+    CSV_CONFIG, STACK_CONFIG, DATA_DIR, NUMPY_AVAILABLE, NUMPY_MIN_DOCS, _STACK_COLS,
+    BM25, NumpyBM25, _load_csv
+)
+
+TOP_KS = [None, 1, 3, 10, 50]
+
+
+def generate_corpus(num_docs, rng):
+    """Documents drawn from a skewed vocabulary, so common terms and tied scores occur"""
+    vocabulary = [f"term{i}" for i in range(500)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return [" ".join(rng.choices(vocabulary, weights, k=rng.randint(3, 40))) for _ in range(num_docs)]
+
+
+def generate_queries(bm25, num_queries, rng):
+    """Queries of 1-4 indexed terms, some with a term that is not indexed"""
+    vocabulary = sorted(bm25.postings)
+    queries = []
+    for i in range(num_queries):
+        words = rng.sample(vocabulary, min(len(vocabulary), rng.randint(1, 4)))
+        if i % 10 == 0:
+            words.append("zzunindexed")
+        queries.append(" ".join(words))
+    return queries
+
+
+def check_corpus(name, documents, num_queries, rng):
+    """Compare both scorers on one corpus; returns the number of mismatches"""
+    bm25 = BM25()
+    bm25.fit(documents)
+    numpy_bm25 = NumpyBM25.from_state(bm25.state())
+
+    mismatches = 0
+    queries = generate_queries(bm25, num_queries, rng) if bm25.postings else []
+    for query in queries:
+        for top_k in TOP_KS:
+            if bm25.score(query, top_k) != numpy_bm25.score(query, top_k):
+                if mismatches == 0:
+                    print(f"  [!!] {name}: query {query!r}, top_k={top_k}")
+                mismatches += 1
+
+    status = "OK" if mismatches == 0 else f"{mismatches} mismatches"
+    print(f"{name}: {len(documents)} docs, {len(queries)} queries x {len(TOP_KS)} top_k - {status}")
+    return mismatches
+
+
+def data_corpora():
+    """(name, documents) for every domain and stack CSV, built as core._build_index does"""
+    configs = [(config["file"], config["search_cols"]) for config in CSV_CONFIG.values()]
+    configs += [(config["file"], _STACK_COLS["search_cols"]) for config in STACK_CONFIG.values()]
+    for filename, search_cols in configs:
+        filepath = DATA_DIR / filename
+        if not filepath.exists():
+            continue
+        data = _load_csv(filepath)
+        yield filename, [" ".join(str(data.value(idx, col)) for col in search_cols) for idx in range(len(data))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check NumpyBM25 against BM25")
+    parser.add_argument("--docs", type=int, default=2 * NUMPY_MIN_DOCS, help="Generated corpus size")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per corpus")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("NumPy is not installed; only the pure-Python scorer is in use, nothing to compare")
+        sys.exit(0)
+
+    rng = random.Random(args.seed)
+    corpora = [("generated", generate_corpus(max(args.docs, NUMPY_MIN_DOCS), rng))]
+    corpora.extend(data_corpora())
+
+    mismatches = sum(check_corpus(name, documents, args.queries, rng) for name, documents in corpora)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Client - thin client for the resident search server
+
+search.py calls daemon_search() first and falls back to in-process search when
+no server is listening. Set UIPRO_SEARCH_PORT / UIPRO_SEARCH_HOST to point at a
+non-default server, or UIPRO_NO_DAEMON=1 to always search in-process.
+"""
+
+import http.client
+import json
+import os
+
+DEFAULT_HOST = os.environ.get("UIPRO_SEARCH_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("UIPRO_SEARCH_PORT", "8765"))
+TIMEOUT = 2.0
+
+
+def daemon_search(query, domain=None, stack=None, max_results=None, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Search through the running server; returns None if it is not reachable"""
+    if os.environ.get("UIPRO_NO_DAEMON"):
+        return None
+
+    payload = {"query": query}
+    if domain:
+        payload["domain"] = domain
+    if stack:
+        payload["stack"] = stack
+    if max_results is not None:
+        payload["max_results"] = max_results
+
+    conn = http.client.HTTPConnection(host, port, timeout=TIMEOUT)
+    try:
+        conn.request("POST", "/search", body=json.dumps(payload), headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        if response.status != 200:
+            return None
+        return json.loads(response.read().decode('utf-8'))
+    except (OSError, http.client.HTTPException, ValueError):
+        return None
+    finally:
+        conn.close()
@@ -5,14 +5,29 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import importlib.util
+import marshal
+import os
 import re
+import tempfile
+import threading
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
+INDEX_DIR = Path(__file__).parent.parent / ".index"
+INDEX_VERSION = 3
 MAX_RESULTS = 3
+RESULT_CACHE_SIZE = 256
+
+# NumPy is optional: corpora with at least NUMPY_MIN_DOCS rows are scored with the
+# vectorized backend when it is installed, everything else uses pure Python.
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+NUMPY_MIN_DOCS = 1000
 
 CSV_CONFIG = {
     "style": {
@@ -103,11 +118,12 @@ class BM25:
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
-        self.corpus = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}  # term -> {doc_idx: term frequency}
+        self.doc_norms = []  # per-document length normalization k1 * (1 - b + b * dl / avgdl)
         self.N = 0
 
     def tokenize(self, text):
@@ -117,76 +133,415 @@ class BM25:
 
     def fit(self, documents):
         """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        corpus = [self.tokenize(doc) for doc in documents]
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
+        for idx, doc in enumerate(corpus):
             for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+                term_docs = self.postings.setdefault(word, {})
+                term_docs[idx] = term_docs.get(idx, 0) + 1
 
-        for word, freq in self.doc_freqs.items():
+        for word, term_docs in self.postings.items():
+            freq = len(term_docs)
+            self.doc_freqs[word] = freq
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
-
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
-
-            scores.append((idx, score))
+        self._compute_norms()
+
+    def _compute_norms(self):
+        """Precompute the document-length part of the BM25 denominator"""
+        self.doc_norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
+
+    def state(self):
+        """Return the fitted index as plain data (for on-disk persistence)"""
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "doc_lengths": self.doc_lengths,
+            "avgdl": self.avgdl,
+            "idf": self.idf,
+            "doc_freqs": dict(self.doc_freqs),
+            "postings": self.postings,
+            "N": self.N
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a fitted BM25 from data returned by state()"""
+        bm25 = cls(state["k1"], state["b"])
+        bm25.doc_lengths = state["doc_lengths"]
+        bm25.avgdl = state["avgdl"]
+        bm25.idf = state["idf"]
+        bm25.doc_freqs.update(state["doc_freqs"])
+        bm25.postings = state["postings"]
+        bm25.N = state["N"]
+        if bm25.N:
+            bm25._compute_norms()
+        return bm25
+
+    def score(self, query, top_k=None):
+        """
+        Score documents against query, term-at-a-time over the postings.
+
+        Only documents containing at least one query token are scored, so the
+        cost scales with the query terms' postings rather than corpus size.
+        Returns (doc_idx, score) pairs sorted by descending score (ties by
+        document order), limited to the top_k best when given.
+        """
+        scores = {}
+        numerator_scale = self.k1 + 1
+        doc_norms = self.doc_norms
+
+        for token in self.tokenize(query):
+            term_docs = self.postings.get(token)
+            if not term_docs:
+                continue
+            idf = self.idf[token]
+            for idx, tf in term_docs.items():
+                scores[idx] = scores.get(idx, 0) + idf * (tf * numerator_scale) / (tf + doc_norms[idx])
+
+        rank_key = lambda item: (item[1], -item[0])
+        if top_k is not None:
+            return heapq.nlargest(top_k, scores.items(), key=rank_key)
+        return sorted(scores.items(), key=rank_key, reverse=True)
+
+
+class NumpyBM25(BM25):
+    """BM25 scored in one vectorized pass over a sparse term-document matrix"""
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    def __init__(self, k1=1.5, b=0.75):
+        super().__init__(k1, b)
+        self._matrix = None
+
+    def _build_matrix(self):
+        """Pack the postings into CSR arrays (one row per term)"""
+        import numpy as np
+
+        term_rows = {}
+        indptr = [0]
+        doc_ids = []
+        tfs = []
+        for row, (term, term_docs) in enumerate(self.postings.items()):
+            term_rows[term] = row
+            doc_ids.extend(term_docs.keys())
+            tfs.extend(term_docs.values())
+            indptr.append(len(doc_ids))
+
+        self._matrix = {
+            "np": np,
+            "term_rows": term_rows,
+            "indptr": np.array(indptr, dtype=np.int64),
+            "doc_ids": np.array(doc_ids, dtype=np.int64),
+            "tfs": np.array(tfs, dtype=np.float64),
+            "idf": np.array([self.idf[term] for term in term_rows], dtype=np.float64),
+            "doc_norms": np.array(self.doc_norms, dtype=np.float64)
+        }
+
+    def score(self, query, top_k=None):
+        """Same contract as BM25.score(), computed with NumPy"""
+        if self._matrix is None:
+            self._build_matrix()
+        m = self._matrix
+        np = m["np"]
+
+        rows = [m["term_rows"][token] for token in self.tokenize(query) if token in m["term_rows"]]
+        if not rows:
+            return []
+
+        # Gather the postings of every query token (in query order, so per-document
+        # sums are accumulated in the same order as the pure-Python scorer)
+        indptr = m["indptr"]
+        slices = [np.arange(indptr[row], indptr[row + 1]) for row in rows]
+        positions = np.concatenate(slices)
+        ids = m["doc_ids"][positions]
+        tf = m["tfs"][positions]
+        idf = np.repeat(m["idf"][rows], [len(sl) for sl in slices])
+
+        contrib = idf * (tf * (self.k1 + 1)) / (tf + m["doc_norms"][ids])
+        scores = np.bincount(ids, weights=contrib, minlength=self.N)
+
+        candidates = np.flatnonzero(np.bincount(ids, minlength=self.N))
+        candidate_scores = scores[candidates]
+        if top_k is not None and 0 < top_k < len(candidates):
+            # Keep everything scoring at least the k-th best (ties included) before sorting
+            kth = np.partition(candidate_scores, len(candidates) - top_k)[len(candidates) - top_k]
+            keep = candidate_scores >= kth
+            candidates, candidate_scores = candidates[keep], candidate_scores[keep]
+
+        order = np.lexsort((candidates, -candidate_scores))
+        if top_k is not None:
+            order = order[:top_k]
+        return [(int(candidates[i]), float(candidate_scores[i])) for i in order]
+
+
+def _bm25_class(num_docs):
+    """Pick the scorer for a corpus of the given size"""
+    if NUMPY_AVAILABLE and num_docs >= NUMPY_MIN_DOCS:
+        return NumpyBM25
+    return BM25
+
+
+# ============ COLUMNAR STORAGE ============
+class ColumnTable:
+    """
+    Column-oriented CSV storage: one list per column instead of one dict per row.
+
+    Repeated cell values (categories, severities, platforms...) are interned so
+    each distinct string is stored once. Rows are only materialized as dicts for
+    the hits that are actually returned.
+    """
+
+    __slots__ = ("fieldnames", "columns", "num_rows")
+
+    def __init__(self, fieldnames, columns, num_rows):
+        self.fieldnames = fieldnames
+        self.columns = columns
+        self.num_rows = num_rows
+
+    @classmethod
+    def from_csv(cls, f):
+        """Read a CSV file object into a ColumnTable"""
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames or [])
+        columns = {col: [] for col in fieldnames}
+        interned = {}
+        num_rows = 0
+        for row in reader:
+            for col in fieldnames:
+                value = row[col]
+                columns[col].append(interned.setdefault(value, value))
+            num_rows += 1
+        return cls(fieldnames, columns, num_rows)
+
+    def state(self):
+        """Return the table as plain data (for on-disk persistence)"""
+        return {"fieldnames": self.fieldnames, "columns": self.columns, "num_rows": self.num_rows}
+
+    def __len__(self):
+        return self.num_rows
+
+    def __contains__(self, col):
+        return col in self.columns
+
+    def value(self, idx, col, default=""):
+        """Cell value of row idx, or default if the column does not exist"""
+        values = self.columns.get(col)
+        return values[idx] if values is not None else default
+
+    def row(self, idx, cols=None):
+        """Materialize row idx as a dict over cols (default: all columns present)"""
+        cols = self.fieldnames if cols is None else cols
+        return {col: self.columns[col][idx] for col in cols if col in self.columns}
 
 
 # ============ SEARCH FUNCTIONS ============
 def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
+    """Load CSV into a ColumnTable"""
     with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+        return ColumnTable.from_csv(f)
+
+
+def _file_hash(filepath):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _index_path(filepath):
+    """Location of the compiled index for a data CSV"""
+    try:
+        name = filepath.resolve().relative_to(DATA_DIR.resolve()).as_posix()
+    except ValueError:
+        name = filepath.name
+    return INDEX_DIR / (name.replace("/", "__") + ".idx")
+
+
+def _read_index(index_path):
+    """
+    Read a compiled index, or None if it is missing, unreadable or outdated.
+
+    Indexes are stored with marshal rather than pickle: they hold only dicts,
+    lists, strings and numbers, and loading one never runs code.
+    """
+    try:
+        with open(index_path, 'rb') as f:
+            index = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def _write_index(index_path, index):
+    """Atomically write a compiled index; failures only cost a rebuild next time"""
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump(index, f)
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _build_index(filepath, search_cols):
+    """Parse a CSV and fit BM25 over its search columns"""
+    data = _load_csv(filepath)
+
+    # Build documents from search columns
+    documents = [" ".join(str(data.value(idx, col)) for col in search_cols) for idx in range(len(data))]
+
+    bm25 = _bm25_class(len(documents))()
+    bm25.fit(documents)
+    return data, bm25
+
+
+def _load_index(filepath, search_cols):
+    """
+    Return (table, bm25) for a CSV from its compiled on-disk index.
+
+    The index is reused while the CSV's mtime and size are unchanged. If they
+    changed but the content hash did not (e.g. a checkout touched the file), the
+    index is re-stamped instead of rebuilt. Otherwise the CSV is re-parsed.
+    """
+    index_path = _index_path(filepath)
+    stat = filepath.stat()
+    index = _read_index(index_path)
+
+    if index is not None and index["search_cols"] == list(search_cols):
+        if (index["mtime_ns"], index["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return ColumnTable(**index["table"]), _bm25_class(index["bm25"]["N"]).from_state(index["bm25"])
+        digest = _file_hash(filepath)
+        if index["sha256"] == digest:
+            index["mtime_ns"], index["size"] = stat.st_mtime_ns, stat.st_size
+            _write_index(index_path, index)
+            return ColumnTable(**index["table"]), _bm25_class(index["bm25"]["N"]).from_state(index["bm25"])
+    else:
+        digest = _file_hash(filepath)
+
+    data, bm25 = _build_index(filepath, search_cols)
+    _write_index(index_path, {
+        "version": INDEX_VERSION,
+        "search_cols": list(search_cols),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "table": data.state(),
+        "bm25": bm25.state()
+    })
+    return data, bm25
+
+
+# Indexes already loaded by this process: (path, search_cols) -> (stamp, table, bm25)
+_LOADED_INDEXES = {}
+
+
+def _get_index(filepath, search_cols):
+    """Return (table, bm25), loading each index once per process while the CSV is unchanged"""
+    stat = filepath.stat()
+    key = (str(filepath), tuple(search_cols))
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    loaded = _LOADED_INDEXES.get(key)
+    if loaded is not None and loaded[0] == stamp:
+        return loaded[1], loaded[2]
+
+    data, bm25 = _load_index(filepath, search_cols)
+    _LOADED_INDEXES[key] = (stamp, data, bm25)
+    return data, bm25
+
+
+class _ResultCache:
+    """Thread-safe bounded LRU of search results with hit/miss counters"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_RESULT_CACHE = _ResultCache(RESULT_CACHE_SIZE)
+
+
+def search_cache_info():
+    """Return hit/miss counters and size of the search result cache"""
+    return _RESULT_CACHE.info()
+
+
+def clear_search_cache():
+    """Drop all cached search results and reset the counters"""
+    _RESULT_CACHE.clear()
 
 
 def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
+    """Core search function using BM25, memoized per data file version"""
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
+    # Keyed on the CSV's mtime/size so edits to the data invalidate old entries
+    stat = filepath.stat()
+    cache_key = (str(filepath), tuple(output_cols), query, max_results, stat.st_mtime_ns, stat.st_size)
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is None:
+        cached = _rank_csv(filepath, search_cols, output_cols, query, max_results)
+        _RESULT_CACHE.put(cache_key, cached)
+
+    # Hand out copies so callers can't mutate cached rows
+    return [dict(row) for row in cached]
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+
+def _rank_csv(filepath, search_cols, output_cols, query, max_results):
+    """Rank a CSV's rows against query and project the top hits to output_cols"""
+    data, bm25 = _get_index(filepath, search_cols)
 
     # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    ranked = bm25.score(query, max_results)
 
     # Get top results with score > 0
     results = []
-    for idx, score in ranked[:max_results]:
+    for idx, score in ranked:
         if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+            results.append(data.row(idx, output_cols))
 
     return results
 
@@ -256,3 +611,42 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def query_error(item):
+    """
+    Why a search_many() query dict is malformed, or None if it is usable.
+
+    Callers taking queries from outside (batch input, the search server)
+    check each one first so a bad query is reported instead of raising.
+    """
+    if not isinstance(item, dict):
+        return "query must be a JSON object"
+    if not isinstance(item.get("query"), str) or not item["query"].strip():
+        return "'query' must be a non-empty string"
+    for key in ("domain", "stack"):
+        if item.get(key) is not None and not isinstance(item[key], str):
+            return f"'{key}' must be a string"
+    limit = item.get("max_results")
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 1):
+        return "'max_results' must be a positive integer"
+    return None
+
+
+def search_many(queries, max_results=MAX_RESULTS):
+    """
+    Run many searches in one process, yielding one result dict per query.
+
+    Each query is either a plain string (auto-detected domain) or a dict with
+    "query" and optional "domain", "stack" and "max_results" keys. Every domain
+    index is loaded once and shared by all queries against it.
+    """
+    for item in queries:
+        if isinstance(item, str):
+            item = {"query": item}
+        query = item.get("query", "")
+        limit = item.get("max_results", max_results)
+        if item.get("stack"):
+            yield search_stack(query, item["stack"], limit)
+        else:
+            yield search(query, item.get("domain"), limit)
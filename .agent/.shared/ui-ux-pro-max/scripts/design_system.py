@@ -11,14 +11,17 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+    result = generate_design_system("SaaS dashboard", "My Project", persist=True, pages=["dashboard", "settings"])
 """
 
 import csv
+import hashlib
 import json
 import os
+import re
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, CSV_CONFIG, DATA_DIR, _get_index
 
 
 # ============ CONFIGURATION ============
@@ -33,20 +36,88 @@ SEARCH_CONFIG = {
 }
 
 
+# ============ REASONING RULES ============
+class ReasoningIndex:
+    """Compiled lookup over ui-reasoning.csv rules.
+
+    Resolution order matches the original linear scans: exact UI_Category
+    match, then substring match either way, then any UI_Category keyword
+    contained in the category. The first rule in file order wins at each step.
+    """
+
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.exact = {}        # lowercased UI_Category -> rule position
+        self.categories = []   # lowercased UI_Category per rule, for the substring fallback
+        self.keywords = {}     # UI_Category keyword -> first rule position using it
+        self.decision_rules = []
+        self._resolved = {}    # lowercased category -> rule position (or None)
+
+        for pos, rule in enumerate(rules):
+            ui_cat = rule.get("UI_Category", "").lower()
+            self.exact.setdefault(ui_cat, pos)
+            self.categories.append(ui_cat)
+            for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                self.keywords.setdefault(kw, pos)
+            try:
+                parsed = json.loads(rule.get("Decision_Rules", "{}"))
+            except json.JSONDecodeError:
+                parsed = {}
+            self.decision_rules.append(parsed if isinstance(parsed, dict) else {})
+
+    def resolve(self, category: str):
+        """Return the position of the rule matching category, or None."""
+        category_lower = category.lower()
+        if category_lower in self._resolved:
+            return self._resolved[category_lower]
+
+        pos = self.exact.get(category_lower)
+        if pos is None:
+            pos = next((i for i, ui_cat in enumerate(self.categories)
+                        if ui_cat in category_lower or category_lower in ui_cat), None)
+        if pos is None:
+            pos = min((i for kw, i in self.keywords.items() if kw in category_lower), default=None)
+
+        self._resolved[category_lower] = pos
+        return pos
+
+
+# Compiled index for the current ui-reasoning.csv: ((mtime_ns, size), ReasoningIndex)
+_REASONING_INDEX = None
+
+
+def load_reasoning_index() -> ReasoningIndex:
+    """Return the compiled reasoning rules, rebuilding them only when the CSV changes."""
+    global _REASONING_INDEX
+    filepath = DATA_DIR / REASONING_FILE
+    if not filepath.exists():
+        return ReasoningIndex([])
+
+    stat = filepath.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if _REASONING_INDEX is None or _REASONING_INDEX[0] != stamp:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            _REASONING_INDEX = (stamp, ReasoningIndex(list(csv.DictReader(f))))
+    return _REASONING_INDEX[1]
+
+
+def preload_search_indexes():
+    """Load the index of every SEARCH_CONFIG domain into core's per-process table."""
+    for domain in SEARCH_CONFIG:
+        config = CSV_CONFIG[domain]
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, config["search_cols"])
+
+
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
     def __init__(self):
-        self.reasoning_data = self._load_reasoning()
-
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+        self.reasoning = load_reasoning_index()
+        self.reasoning_data = self.reasoning.rules
+        preload_search_indexes()
 
     def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
         """Execute searches across multiple domains."""
@@ -63,31 +134,13 @@ class DesignSystemGenerator:
 
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
-
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
+        pos = self.reasoning.resolve(category)
+        return self.reasoning.rules[pos] if pos is not None else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+        pos = self.reasoning.resolve(category)
+        rule = self.reasoning.rules[pos] if pos is not None else {}
 
         if not rule:
             return {
@@ -101,12 +154,8 @@ class DesignSystemGenerator:
                 "severity": "MEDIUM"
             }
 
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
+        # Decision rules JSON is parsed once when the index is built
+        decision_rules = dict(self.reasoning.decision_rules[pos])
 
         return {
             "pattern": rule.get("Recommended_Pattern", ""),
@@ -460,7 +509,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           pages=None) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,6 +521,7 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        pages: Optional list of page names (or {page: page_query} dict) to persist in bulk
 
     Returns:
         Formatted design system string
@@ -480,7 +531,7 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     
     # Persist to files if requested
     if persist:
-        persist_design_system(design_system, page, output_dir, query)
+        persist_design_system(design_system, page, output_dir, query, pages=pages)
 
     if output_format == "markdown":
         return format_markdown(design_system)
@@ -488,18 +539,60 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+# The "Generated:" timestamp line is ignored when deciding whether a file changed
+_GENERATED_LINE = re.compile(r'^(?:> )?\*\*Generated:\*\* .*$', re.MULTILINE)
+
+
+def _content_hash(content: str) -> str:
+    """Hash persisted markdown, ignoring its generation timestamp."""
+    return hashlib.sha256(_GENERATED_LINE.sub("", content).encode('utf-8')).hexdigest()
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """
+    Atomically write content to path unless the file already has the same content.
+
+    Returns True if the file was written, False if it was left untouched.
+    """
+    try:
+        existing = path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        existing = None
+    if existing is not None and _content_hash(existing) == _content_hash(content):
+        return False
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass  # open() failed before the file existed; keep the original error
+        raise
+    return True
+
+
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          pages=None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
+
+    Files whose content is unchanged (ignoring the generation timestamp) are not
+    rewritten, so their mtimes stay put and file watchers are not triggered.
     
     Args:
         design_system: The generated design system dictionary
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        pages: Optional list of page names, or {page: page_query} dict, persisted in
+               the same call against the same master design system
     
     Returns:
-        dict with created file paths and status
+        dict with created file paths, which of them were written and which were unchanged
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
@@ -511,31 +604,44 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     pages_dir = design_system_dir / "pages"
     
     created_files = []
+    written_files = []
+    unchanged_files = []
+
+    def persist(path: Path, content: str):
+        created_files.append(str(path))
+        if _write_if_changed(path, content):
+            written_files.append(str(path))
+        else:
+            unchanged_files.append(str(path))
     
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
     
-    master_file = design_system_dir / "MASTER.md"
-    
     # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
+    persist(design_system_dir / "MASTER.md", format_master_md(design_system))
     
-    # If page is specified, create page override file with intelligent content
+    # Collect page override requests: the single page plus any bulk pages
+    page_queries = {}
     if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+        page_queries[page] = page_query
+    if isinstance(pages, dict):
+        page_queries.update(pages)
+    elif pages:
+        for name in pages:
+            page_queries.setdefault(name, page_query)
+
+    # Create page override files with intelligent content
+    for page_name, query in page_queries.items():
+        page_file = pages_dir / f"{page_name.lower().replace(' ', '-')}.md"
+        persist(page_file, format_page_override_md(design_system, page_name, query))
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": created_files,
+        "written_files": written_files,
+        "unchanged_files": unchanged_files
     }
 
 
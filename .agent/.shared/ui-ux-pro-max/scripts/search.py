@@ -5,6 +5,7 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --batch [queries.txt] [--domain <domain>] [--stack <stack>]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,10 +13,25 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+  --pages      Comma-separated page names to persist in one run (e.g. "dashboard,settings")
+               Files whose content did not change are left untouched.
+
+Search server:
+  python server.py keeps every index in memory; plain and --stack searches go
+  through it automatically when it is running (--no-daemon to bypass).
+
+Batch mode:
+  --batch      Read one query per line from a file (or stdin when omitted) and
+               stream one JSON result per line. A line may also be a JSON object:
+               {"query": "...", "domain": "color", "stack": "react", "max_results": 5}
+               A malformed line yields {"error": "...", "line": n} and the batch goes on.
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
+import json
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack, search_many, query_error
+from client import daemon_search
 from design_system import generate_design_system, persist_design_system
 
 
@@ -45,13 +61,64 @@ def format_output(result):
     return "\n".join(output)
 
 
+def read_batch_queries(lines, domain=None, stack=None):
+    """
+    Parse batch input lines into search_many() queries.
+
+    Yields (line number, query, error): query is None and error says why when
+    the line is not valid JSON or not a usable query.
+    """
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_num, None, f"Invalid JSON: {e}"
+                continue
+        else:
+            item = {"query": line}
+        error = query_error(item)
+        if error:
+            yield line_num, None, error
+            continue
+        if domain and "domain" not in item:
+            item["domain"] = domain
+        if stack and "stack" not in item:
+            item["stack"] = stack
+        yield line_num, item, None
+
+
+def run_batch(source, domain=None, stack=None, max_results=MAX_RESULTS):
+    """
+    Stream JSON Lines results for every query in source ("-" for stdin).
+
+    A malformed line produces {"error": ..., "line": n} and the batch goes on.
+    """
+    stream = sys.stdin if source == "-" else open(source, 'r', encoding='utf-8')
+    try:
+        for line_num, item, error in read_batch_queries(stream, domain, stack):
+            if error:
+                result = {"error": error, "line": line_num}
+            else:
+                result = next(search_many([item], max_results))
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--batch", nargs="?", const="-", default=None, metavar="FILE", help="Read queries from FILE (or stdin) and stream JSON Lines results")
+    parser.add_argument("--no-daemon", action="store_true", help="Search in-process even if the search server is running")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
@@ -59,19 +126,27 @@ if __name__ == "__main__":
     # Persistence (Master + Overrides pattern)
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
+    parser.add_argument("--pages", type=str, default=None, help="Comma-separated page names to persist in bulk (reuses one master design system)")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
 
     args = parser.parse_args()
+    if args.query is None and args.batch is None:
+        parser.error("a query is required unless --batch is given")
 
-    # Design system takes priority
-    if args.design_system:
+    # Batch mode: one process, one index load per domain
+    if args.batch is not None:
+        run_batch(args.batch, args.domain, args.stack, args.max_results)
+    # Design system
+    elif args.design_system:
+        bulk_pages = [p.strip() for p in args.pages.split(",") if p.strip()] if args.pages else []
         result = generate_design_system(
             args.query, 
             args.project_name, 
             args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            pages=bulk_pages
         )
         print(result)
         
@@ -81,8 +156,8 @@ if __name__ == "__main__":
             print("\n" + "=" * 60)
             print(f"✅ Design system persisted to design-system/{project_slug}/")
             print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
-            if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
+            for page_name in ([args.page] if args.page else []) + bulk_pages:
+                page_filename = page_name.lower().replace(' ', '-')
                 print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
             print("")
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
@@ -90,17 +165,19 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        result = None if args.no_daemon else daemon_search(args.query, stack=args.stack, max_results=args.max_results)
+        if result is None:
+            result = search_stack(args.query, args.stack, args.max_results)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        result = None if args.no_daemon else daemon_search(args.query, domain=args.domain, max_results=args.max_results)
+        if result is None:
+            result = search(args.query, args.domain, args.max_results)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Server - keeps every BM25 index resident in memory
+Usage: python server.py [--host 127.0.0.1] [--port 8765]
+
+Endpoints (localhost HTTP, JSON):
+  GET  /health   -> {"status": "ok", "indexes": <count>, "cache": <result cache hits/misses>}
+  POST /search   -> body {"query": "...", "domain": "...", "stack": "...", "max_results": 3}
+                    returns the same dict as core.search() / core.search_stack()
+
+Indexes for every CSV_CONFIG and STACK_CONFIG file are loaded at startup and
+revalidated against the CSV's mtime on each request, so edits to data/ are
+picked up without restarting. search.py uses the server automatically when
+it is running (see client.py).
+"""
+
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core import CSV_CONFIG, STACK_CONFIG, DATA_DIR, MAX_RESULTS, _STACK_COLS, _get_index, search_many, search_cache_info, query_error
+from client import DEFAULT_HOST, DEFAULT_PORT
+
+
+def preload_indexes():
+    """Load every domain and stack index; returns how many were loaded"""
+    count = 0
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, config["search_cols"])
+            count += 1
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, _STACK_COLS["search_cols"])
+            count += 1
+    return count
+
+
+class SearchHandler(BaseHTTPRequestHandler):
+    """JSON request handler for /health and /search"""
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "indexes": self.server.index_count, "cache": search_cache_info()})
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/search":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"})
+            return
+        error = query_error(request)
+        if error:
+            self._send_json(400, {"error": f"Invalid request: {error}"})
+            return
+
+        result = next(search_many([request], request.get("max_results", MAX_RESULTS)))
+        self._send_json(200, result)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+        pass
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Preload indexes and serve until interrupted"""
+    server = ThreadingHTTPServer((host, port), SearchHandler)
+    server.daemon_threads = True
+    server.index_count = preload_indexes()
+    print(f"UI Pro Max search server on http://{host}:{port} ({server.index_count} indexes loaded)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Search Server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    serve(args.host, args.port)
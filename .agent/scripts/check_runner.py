@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Check Runner - Antigravity Kit
+==============================
+
+Shared execution layer for checklist.py and verify_all.py.
+
+Validators that expose an in-process entry point - a ``main(argv=None)``
+function taking the command-line arguments - run in reusable worker
+processes: a worker imports a validator once and calls it directly for every
+later check, instead of starting a fresh interpreter and fresh imports per
+check. stdout/stderr are captured and ``SystemExit`` is turned into the exit
+code. Each concurrently running check has a worker of its own, so CPU-bound
+validators run in parallel rather than sharing one GIL, and a check that
+exceeds its timeout is stopped by killing its worker.
+
+Scripts without such an entry point, or any script when ``isolate=True``, run
+in a subprocess as before.
+"""
+
+import atexit
+import importlib.util
+import inspect
+import io
+import multiprocessing
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import findings_cache
+import project_files
+
+
+# ============================================================================
+#  OUTPUT CAPTURE
+# ============================================================================
+
+class _ThreadLocalStream:
+    """Stream proxy that writes to a per-thread buffer while a check is captured"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def start_capture(self) -> io.StringIO:
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def stop_capture(self):
+        self._local.buffer = None
+
+    def _target(self):
+        return getattr(self._local, "buffer", None) or self._stream
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+_install_lock = threading.Lock()
+
+
+def _install_capture():
+    """Replace sys.stdout/sys.stderr with thread-aware proxies (once)"""
+    with _install_lock:
+        if not isinstance(sys.stdout, _ThreadLocalStream):
+            sys.stdout = _ThreadLocalStream(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadLocalStream):
+            sys.stderr = _ThreadLocalStream(sys.stderr)
+
+
+# ============================================================================
+#  ENTRY POINTS
+# ============================================================================
+
+_entry_points = {}
+_entry_lock = threading.Lock()
+
+
+def load_entry_point(script_path: Path) -> Optional[Callable]:
+    """
+    Import a validator script and return its ``main(argv)`` function.
+
+    Returns None if the script has no ``main`` accepting ``argv`` or cannot be
+    imported, in which case callers fall back to a subprocess.
+    """
+    key = str(Path(script_path).resolve())
+    with _entry_lock:
+        if key in _entry_points:
+            return _entry_points[key]
+
+        entry = None
+        module_name = f"_agent_check_{Path(key).stem}_{abs(hash(key)):x}"
+        # Like `python script.py`, let the script import modules next to it
+        script_dir = str(Path(key).parent)
+        sys.path.insert(0, script_dir)
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, key)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+            main = getattr(module, "main", None)
+            if callable(main) and "argv" in inspect.signature(main).parameters:
+                entry = main
+        except Exception:
+            sys.modules.pop(module_name, None)
+            entry = None
+        finally:
+            sys.path.remove(script_dir)
+
+        _entry_points[key] = entry
+        return entry
+
+
+def _exit_code(code) -> int:
+    """Translate a SystemExit code the way the interpreter does"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+def run_in_process(entry: Callable, argv: List[str]):
+    """
+    Call a validator entry point with captured output.
+
+    Returns:
+        (returncode, stdout, stderr, cpu_seconds)
+    """
+    _install_capture()
+    stdout = sys.stdout.start_capture()
+    stderr = sys.stderr.start_capture()
+    cpu_start = time.thread_time()
+    try:
+        entry(argv)
+        returncode = 0
+    except SystemExit as e:
+        returncode = _exit_code(e.code)
+        if isinstance(e.code, str):
+            stderr.write(e.code + "\n")
+    except Exception:
+        returncode = 1
+        stderr.write(traceback.format_exc())
+    finally:
+        cpu = time.thread_time() - cpu_start
+        sys.stdout.stop_capture()
+        sys.stderr.stop_capture()
+    return returncode, stdout.getvalue(), stderr.getvalue(), cpu
+
+
+# ============================================================================
+#  WORKER PROCESSES
+# ============================================================================
+
+# Idle worker processes; a check takes one (or starts a new one) and hands it
+# back when done, so there are never more workers than checks that ran at the
+# same time.
+_idle_workers = queue.SimpleQueue()
+
+# How long a killed worker gets to disappear before we give up on it
+KILL_TIMEOUT = 10
+
+
+def _init_worker(cache_enabled: bool, limits: dict):
+    """Give a worker the orchestrator's findings cache and --since/--staged settings"""
+    findings_cache.ENABLED = cache_enabled
+    for project_path, paths in limits.items():
+        project_files.limit_to(project_path, paths)
+
+
+def _run_in_worker(script_path: str, argv: List[str]):
+    """Worker side of run_check: None if the script has no entry point"""
+    entry = load_entry_point(Path(script_path))
+    if entry is None:
+        return None
+    return run_in_process(entry, argv)
+
+
+def _worker_loop(conn, cache_enabled: bool, limits: dict):
+    """Worker process body: run (script_path, argv) requests until the pipe closes"""
+    _init_worker(cache_enabled, limits)
+    while True:
+        try:
+            script_path, argv = conn.recv()
+        except EOFError:
+            return
+        try:
+            reply = ("ok", _run_in_worker(script_path, argv))
+        except BaseException:
+            reply = ("error", traceback.format_exc())
+        conn.send(reply)
+
+
+class _Worker:
+    """A worker process and the pipe to it, owned by the orchestrator so it can be killed"""
+
+    def __init__(self):
+        # spawn, not fork: the orchestrators start workers from their own threads.
+        # Not daemonic, since validators may start processes of their own.
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_loop, name="check-worker",
+                                       args=(child_conn, findings_cache.ENABLED, project_files.limits()))
+        self.process.start()
+        child_conn.close()
+        _register_cleanup()
+
+    def call(self, script_path: str, argv: List[str], timeout: int):
+        """
+        Run one check in this worker.
+
+        Raises:
+            subprocess.TimeoutExpired if no reply came within timeout
+            RuntimeError if the worker failed or died
+        """
+        self.conn.send((script_path, argv))
+        if not self.conn.poll(timeout):
+            raise subprocess.TimeoutExpired([script_path] + argv, timeout)
+        try:
+            status, value = self.conn.recv()
+        except EOFError:
+            raise RuntimeError(f"Worker process exited with code {self.process.exitcode} while running {script_path}")
+        if status != "ok":
+            raise RuntimeError(f"Worker process failed while running {script_path}:\n{value}")
+        return value
+
+    def close(self):
+        """Let an idle worker exit on its own (it stops when the pipe closes)"""
+        self.conn.close()
+        self.process.join(KILL_TIMEOUT)
+        if self.process.is_alive():
+            self.kill()
+
+    def kill(self):
+        """
+        Kill the worker and wait for it to go away.
+
+        Raises:
+            RuntimeError if the process is still alive afterwards
+        """
+        self.conn.close()
+        self.process.kill()
+        self.process.join(KILL_TIMEOUT)
+        if self.process.is_alive():
+            raise RuntimeError(f"Could not kill worker process {self.process.pid}")
+        self.process.close()
+
+
+def _take_worker() -> _Worker:
+    try:
+        return _idle_workers.get_nowait()
+    except queue.Empty:
+        return _Worker()
+
+
+def _close_idle_workers():
+    """Stop idle workers at exit so multiprocessing does not wait on them forever"""
+    while True:
+        try:
+            worker = _idle_workers.get_nowait()
+        except queue.Empty:
+            return
+        worker.close()
+
+
+_cleanup_registered = False
+_cleanup_lock = threading.Lock()
+
+
+def _register_cleanup():
+    """
+    Register _close_idle_workers once a worker exists: atexit runs handlers
+    last-registered first, and this must run before multiprocessing's own exit
+    handler, which waits for every child process.
+    """
+    global _cleanup_registered
+    with _cleanup_lock:
+        if not _cleanup_registered:
+            atexit.register(_close_idle_workers)
+            _cleanup_registered = True
+
+
+def run_in_worker(script_path: Path, argv: List[str], timeout: int):
+    """
+    Call a validator entry point in a worker process.
+
+    Returns:
+        (returncode, stdout, stderr, cpu_seconds), or None if the script has
+        no entry point
+    Raises:
+        subprocess.TimeoutExpired if the check ran longer than timeout (the
+        worker is killed)
+    """
+    worker = _take_worker()
+    try:
+        result = worker.call(str(script_path), list(argv), timeout)
+    except BaseException:
+        worker.kill()
+        raise
+    _idle_workers.put(worker)
+    return result
+
+
+# ============================================================================
+#  SUBPROCESS FALLBACK
+# ============================================================================
+
+def run_process(cmd: List[str], timeout: int):
+    """
+    subprocess.run() equivalent that also measures the child's CPU time.
+
+    Returns:
+        (returncode, stdout, stderr, cpu_seconds); cpu_seconds is None where
+        os.wait4 is unavailable (Windows)
+    Raises:
+        subprocess.TimeoutExpired if the process had to be killed
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if not hasattr(os, "wait4"):
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        return proc.returncode, stdout, stderr, None
+
+    # Drain both pipes in threads so wait4 can collect the child's rusage
+    streams = {}
+    readers = [
+        threading.Thread(target=lambda key=key, pipe=pipe: streams.__setitem__(key, pipe.read()))
+        for key, pipe in (("stdout", proc.stdout), ("stderr", proc.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    finally:
+        timer.cancel()
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    for reader in readers:
+        reader.join()
+    proc.stdout.close()
+    proc.stderr.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, streams.get("stdout", ""), streams.get("stderr", ""), rusage.ru_utime + rusage.ru_stime
+
+
+# ============================================================================
+#  PUBLIC API
+# ============================================================================
+
+def run_check(script_path: Path, args: List[str], timeout: int, isolate: bool = False,
+              python: str = sys.executable) -> dict:
+    """
+    Run one validator, in a worker process when it exposes an entry point.
+
+    Returns:
+        dict with keys: returncode, stdout, stderr, cpu, in_process (True when
+        the entry point was called rather than a fresh interpreter started)
+    Raises:
+        subprocess.TimeoutExpired if the check exceeded timeout
+    """
+    result = None if isolate else run_in_worker(script_path, args, timeout)
+    if result is not None:
+        returncode, stdout, stderr, cpu = result
+        in_process = True
+    else:
+        returncode, stdout, stderr, cpu = run_process([python, str(script_path)] + list(args), timeout)
+        in_process = False
+    return {
+        "returncode": returncode,
+        "stdout": stdout,
+        "stderr": stderr,
+        "cpu": cpu,
+        "in_process": in_process
+    }
@@ -9,6 +9,8 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --jobs 1           # Run every check sequentially
+    python scripts/checklist.py . --staged           # Pre-commit: only staged files
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -18,14 +20,31 @@ Priority Order:
     P4: UX Audit (psychology laws, accessibility)
     P5: SEO Check (meta tags, structure)
     P6: Performance (lighthouse - requires URL)
+
+Required checks (Security Scan, Lint Check) run first and stop the checklist
+if they fail. The independent checks after them run concurrently (--jobs).
+Validators exposing a main(argv) entry point run in reusable worker
+processes (see check_runner.py); --isolate runs every check in its own
+subprocess.
+Per-file findings are cached under .agent/.cache/ (see findings_cache.py) so
+unchanged files are not re-analysed; --no-cache turns this off.
+--since <git-ref> / --staged limit file-level validators (security, UX,
+mobile, accessibility, SEO, GEO) to the files git reports as changed;
+project-level checks still run in full.
 """
 
+import os
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+import findings_cache
+import project_files
+from check_runner import run_check
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -73,57 +92,115 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def execute_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+                   isolate: bool = False) -> dict:
     """
-    Run a validation script and capture results
+    Run a validation script and capture results without printing anything.
+    Scripts exposing a main(argv) entry point run in a worker process unless isolate is set.
     
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, error, skipped
     """
     if not check_script_exists(script_path):
-        print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "output": "", "skipped": True}
     
-    print_step(f"Running: {name}")
-    
-    # Build command
-    cmd = [sys.executable, str(script_path), project_path]
+    # Build arguments
+    args = [project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
+        args.append(url)
     
     # Run script
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED")
-        else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
+        result = run_check(script_path, args, timeout=300, isolate=isolate)  # 5 minute timeout
         
         return {
             "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "passed": result["returncode"] == 0,
+            "output": result["stdout"],
+            "error": result["stderr"],
             "skipped": False
         }
     
     except subprocess.TimeoutExpired:
-        print_error(f"{name}: TIMEOUT (>5 minutes)")
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
+        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False, "timeout": True}
     
     except Exception as e:
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
+        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False, "exception": True}
+
+def print_result(result: dict):
+    """Print the status lines for a finished check"""
+    name = result["name"]
+    if result.get("skipped"):
+        print_warning(f"{name}: Script not found, skipping")
+    elif result.get("timeout"):
+        print_error(f"{name}: TIMEOUT (>5 minutes)")
+    elif result.get("exception"):
+        print_error(f"{name}: ERROR - {result['error']}")
+    elif result["passed"]:
+        print_success(f"{name}: PASSED")
+    else:
+        print_error(f"{name}: FAILED")
+        if result.get("error"):
+            print(f"  Error: {result['error'][:200]}")
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               isolate: bool = False) -> dict:
+    """
+    Run a validation script, printing its progress and status
+    
+    Returns:
+        dict with keys: name, passed, output, skipped
+    """
+    if check_script_exists(script_path):
+        print_step(f"Running: {name}")
+    result = execute_script(name, script_path, project_path, url, isolate)
+    print_result(result)
+    return result
+
+def schedule_checks(checks: List[Tuple[str, str, bool]]) -> List[Tuple[bool, list]]:
+    """
+    Group checks into stages that preserve the stop-on-required-failure rule.
+
+    Each required check is a stage of its own (nothing after it starts until it
+    passes). Runs of consecutive non-required checks form one parallel stage.
+
+    Returns:
+        list of (parallel, checks) stages in order
+    """
+    stages = []
+    for check in checks:
+        required = check[2]
+        if not required and stages and stages[-1][0]:
+            stages[-1][1].append(check)
+        else:
+            stages.append((not required, [check]))
+    return stages
+
+def run_stage(checks: list, project_path: Path, jobs: int, url: Optional[str] = None,
+              isolate: bool = False) -> List[dict]:
+    """
+    Run independent checks concurrently (at most `jobs` scripts at a time).
+
+    Output is printed per check in declaration order as soon as each check
+    and all checks before it have finished.
+    """
+    if jobs <= 1 or len(checks) == 1:
+        return [run_script(name, project_path / script_path, str(project_path), url, isolate)
+                for name, script_path, _ in checks]
+
+    results = []
+    with ThreadPoolExecutor(max_workers=min(jobs, len(checks))) as pool:
+        futures = [
+            pool.submit(execute_script, name, project_path / script_path, str(project_path), url, isolate)
+            for name, script_path, _ in checks
+        ]
+        for (name, script_path, _), future in zip(checks, futures):
+            if check_script_exists(project_path / script_path):
+                print_step(f"Running: {name}")
+            result = future.result()
+            print_result(result)
+            results.append(result)
+    return results
 
 def print_summary(results: List[dict]):
     """Print final summary report"""
@@ -172,8 +249,15 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Max checks to run at the same time (default: CPU count)")
+    parser.add_argument("--isolate", action="store_true", help="Run every check in its own subprocess instead of a reusable worker")
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyse every file instead of reusing cached findings")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--since", metavar="REF", help="Only audit files changed since a git ref (file-level checks)")
+    scope.add_argument("--staged", action="store_true", help="Only audit files staged for commit (file-level checks)")
     
     args = parser.parse_args()
+    findings_cache.ENABLED = not args.no_cache
     
     project_path = Path(args.project).resolve()
     
@@ -181,31 +265,46 @@ Examples:
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
     
+    changed = None
+    if args.since or args.staged:
+        try:
+            changed = project_files.git_changed_files(project_path, args.since, args.staged)
+        except (OSError, subprocess.CalledProcessError) as e:
+            detail = e.stderr.strip().splitlines()[0] if getattr(e, "stderr", None) else e
+            print_error(f"Could not list changed files: {detail}")
+            sys.exit(1)
+        project_files.limit_to(project_path, changed)
+    
     print_header("🚀 ANTIGRAVITY KIT - MASTER CHECKLIST")
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
+    if changed is not None:
+        since = "staged for commit" if args.staged else f"changed since {args.since}"
+        print(f"Scope: {len(changed)} file(s) {since}")
+        if args.isolate:
+            print_warning("--isolate: file-level checks cannot be scoped and will scan the whole project")
     
     results = []
     
     # Run core checks
     print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
-        script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
+    for parallel, checks in schedule_checks(CORE_CHECKS):
+        stage_results = run_stage(checks, project_path, args.jobs if parallel else 1, isolate=args.isolate)
+        results.extend(stage_results)
         
         # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
-            sys.exit(1)
+        for (name, _, required), result in zip(checks, stage_results):
+            if required and not result["passed"] and not result.get("skipped"):
+                print_error(f"CRITICAL: {name} failed. Stopping checklist.")
+                print_summary(results)
+                sys.exit(1)
     
     # Run performance checks if URL provided
     if args.url and not args.skip_performance:
         print_header("⚡ PERFORMANCE CHECKS")
         for name, script_path, required in PERFORMANCE_CHECKS:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), args.url, args.isolate)
             results.append(result)
     
     # Print summary
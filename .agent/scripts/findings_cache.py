@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Findings Cache - Antigravity Kit
+================================
+
+Persistent per-file findings cache for the validators run by checklist.py and
+verify_all.py, stored under .agent/.cache/findings/.
+
+Each validator keeps one cache file per project. An entry maps a file's path
+(relative to the project) to the findings produced for it, together with the
+file's SHA-256 and the validator's version - the hash of the validator's own
+source, so editing a validator invalidates everything it cached. A file whose
+mtime and size are unchanged is a hit without being read; otherwise it is
+hashed, and only files whose content actually changed are re-analysed.
+
+Validators import this module optionally, like project_files; run on their own
+they analyse every file as before.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "findings"
+CACHE_FORMAT = 1
+
+# Cleared by the orchestrators' --no-cache flag
+ENABLED = True
+
+
+def source_version(source_file) -> str:
+    """Version string for a validator: the hash of its source file"""
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()[:16]
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FindingsCache:
+    """Findings for one validator over one project"""
+
+    def __init__(self, name: str, version: str, project_path):
+        self.project_path = Path(project_path)
+        root = str(self.project_path.resolve())
+        self.path = CACHE_DIR / f"{name}-{hashlib.sha256(root.encode('utf-8')).hexdigest()[:12]}.json"
+        self.version = version
+        self.entries: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._pending: Dict[str, tuple] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") == CACHE_FORMAT and data.get("version") == self.version:
+            self.entries = data.get("files", {})
+
+    def _key(self, filepath) -> str:
+        try:
+            return Path(filepath).relative_to(self.project_path).as_posix()
+        except ValueError:
+            return Path(filepath).as_posix()
+
+    def lookup(self, filepath) -> Optional[Any]:
+        """Cached findings for filepath, or None if it has to be analysed"""
+        key = self._key(filepath)
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        entry = self.entries.get(key)
+        if entry is not None and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            self.hits += 1
+            return entry["findings"]
+
+        try:
+            sha256 = _file_hash(filepath)
+        except OSError:
+            return None
+        if entry is not None and entry["sha256"] == sha256:
+            with self._lock:
+                entry["mtime_ns"], entry["size"] = st.st_mtime_ns, st.st_size
+                self._dirty = True
+            self.hits += 1
+            return entry["findings"]
+
+        self._pending[key] = (st.st_mtime_ns, st.st_size, sha256)
+        self.misses += 1
+        return None
+
+    def store(self, filepath, findings: Any):
+        """Record the findings for a file that lookup() reported as a miss"""
+        key = self._key(filepath)
+        stat = self._pending.pop(key, None)
+        if stat is None:
+            return
+        with self._lock:
+            self.entries[key] = {"mtime_ns": stat[0], "size": stat[1], "sha256": stat[2], "findings": findings}
+            self._dirty = True
+
+    def save(self):
+        """Write the cache back if anything changed (atomic replace)"""
+        if not self._dirty:
+            return
+        data = {"format": CACHE_FORMAT, "version": self.version, "files": self.entries}
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def open_cache(name: str, source_file, project_path, settings: Any = None) -> Optional[FindingsCache]:
+    """
+    FindingsCache for a validator, or None when caching is disabled. Findings
+    that depend on options pass them as settings (JSON data); changing them
+    invalidates the cache like editing the validator does.
+    """
+    if not ENABLED:
+        return None
+    version = source_version(source_file)
+    if settings is not None:
+        encoded = json.dumps(settings, sort_keys=True).encode('utf-8')
+        version += "-" + hashlib.sha256(encoded).hexdigest()[:8]
+    return FindingsCache(name, version, project_path)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Project Files - Antigravity Kit
+===============================
+
+Shared file inventory for the validators run by checklist.py and verify_all.py.
+
+The project tree is walked once per process (node_modules and .git are never
+entered) and every validator selects its files from that inventory instead of
+running its own os.walk()/glob(). File contents are cached by
+(path, mtime, size), so a file read by several validators is read from disk
+once and re-read only if it changes.
+
+In incremental mode (--since/--staged) the orchestrators record the changed
+files with limit_to(); file-level validators pass changed_only=True and then
+see only those files, while project-level checks still see the whole tree.
+
+Validators import this module optionally; when it is not importable (a
+validator run on its own) they fall back to walking the tree themselves.
+"""
+
+import os
+import subprocess
+import threading
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Directories no validator ever looks into
+PRUNE_DIRS = {'node_modules', '.git'}
+
+# Stop caching contents once this many characters are held in memory
+MAX_CACHED_CHARS = 64 * 1024 * 1024
+
+
+class _Entry:
+    """One file in the inventory"""
+
+    __slots__ = ("path", "dirs", "name", "rel")
+
+    def __init__(self, path: Path, dirs: Tuple[str, ...], name: str):
+        self.path = path   # project_path / relative path, as glob() would return it
+        self.dirs = dirs   # directory parts relative to the project root
+        self.name = name
+        self.rel = "/".join(dirs + (name,))
+
+
+_inventories: Dict[str, List[_Entry]] = {}
+_inventory_lock = threading.Lock()
+
+# Project root -> changed files (POSIX paths relative to the root)
+_changed: Dict[str, Set[str]] = {}
+
+_contents: Dict[Tuple[str, str], Tuple[int, int, str]] = {}
+_contents_lock = threading.Lock()
+_cached_chars = 0
+
+
+def _inventory(project_path) -> List[_Entry]:
+    """Walk project_path once per process and return its files in walk order"""
+    key = str(Path(project_path).resolve())
+    with _inventory_lock:
+        entries = _inventories.get(key)
+        if entries is None:
+            root_path = Path(project_path)
+            entries = []
+            for root, dirs, files in os.walk(project_path):
+                dirs[:] = [d for d in dirs if d not in PRUNE_DIRS]
+                rel_dirs = Path(root).relative_to(project_path).parts
+                base = root_path.joinpath(*rel_dirs)
+                for name in files:
+                    entries.append(_Entry(base / name, rel_dirs, name))
+            _inventories[key] = entries
+        return entries
+
+
+def _entries(project_path, changed_only: bool) -> List[_Entry]:
+    entries = _inventory(project_path)
+    changed = _changed.get(str(Path(project_path).resolve())) if changed_only else None
+    if changed is not None:
+        entries = [e for e in entries if e.rel in changed]
+    return entries
+
+
+def walk_files(project_path, skip_dirs: Iterable[str] = (), changed_only: bool = False) -> List[Path]:
+    """
+    Files under project_path in os.walk() order, as if every directory named
+    in skip_dirs had been pruned from the walk. With changed_only, only files
+    passed to limit_to() (if it was called for this project).
+    """
+    skip = set(skip_dirs)
+    return [e.path for e in _entries(project_path, changed_only) if not skip.intersection(e.dirs)]
+
+
+def glob(project_path, suffixes: Sequence[str], skip_dirs: Iterable[str] = (),
+         changed_only: bool = False) -> List[Path]:
+    """
+    Equivalent of concatenating project_path.glob(f"**/*{suffix}") for each
+    suffix in order, minus files under skip_dirs.
+    """
+    files = walk_files(project_path, skip_dirs, changed_only)
+    return [f for suffix in suffixes for f in files if f.name.endswith(suffix)]
+
+
+def match(project_path, patterns: Sequence[str], skip_dirs: Iterable[str] = (),
+          changed_only: bool = False) -> List[Path]:
+    """
+    Equivalent of concatenating project_path.glob(pattern) for "**/<tail>"
+    patterns whose tail contains no further "**".
+    """
+    entries = _entries(project_path, changed_only)
+    skip = set(skip_dirs)
+    files = []
+    for pattern in patterns:
+        tail = pattern[3:] if pattern.startswith("**/") else pattern
+        for e in entries:
+            if not skip.intersection(e.dirs) and PurePath(*e.dirs, e.name).match(tail):
+                files.append(e.path)
+    return files
+
+
+def read_text(path, errors: str = 'strict') -> str:
+    """
+    Path.read_text(encoding='utf-8', errors=errors), served from memory while
+    the file's mtime and size are unchanged.
+    """
+    global _cached_chars
+    path = str(path)
+    st = os.stat(path)
+    key = (path, errors)
+    cached = _contents.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    with open(path, 'r', encoding='utf-8', errors=errors) as f:
+        content = f.read()
+
+    with _contents_lock:
+        stale = _contents.pop(key, None)
+        if stale is not None:
+            _cached_chars -= len(stale[2])
+        if _cached_chars + len(content) <= MAX_CACHED_CHARS:
+            _contents[key] = (st.st_mtime_ns, st.st_size, content)
+            _cached_chars += len(content)
+    return content
+
+
+# ============================================================================
+#  INCREMENTAL MODE
+# ============================================================================
+
+def _git_paths(project_path, command: str, *args) -> List[str]:
+    """Run a git command that lists paths (NUL-separated) and return them"""
+    result = subprocess.run(
+        ["git", "-C", str(project_path), command, "-z"] + list(args),
+        capture_output=True, text=True, check=True
+    )
+    return [path for path in result.stdout.split('\0') if path]
+
+
+def git_changed_files(project_path, since: Optional[str] = None, staged: bool = False) -> List[str]:
+    """
+    Files under project_path (POSIX paths relative to it) that were added,
+    copied, modified or renamed: staged for commit when staged is set,
+    otherwise changed in the working tree since the git ref `since`,
+    including untracked files. Deleted files are left out.
+
+    Raises:
+        subprocess.CalledProcessError if git fails (not a repository, bad ref)
+        OSError if git is not installed
+    """
+    if staged:
+        return _git_paths(project_path, "diff", "--name-only", "--relative", "--diff-filter=ACMR", "--cached")
+    changed = _git_paths(project_path, "diff", "--name-only", "--relative", "--diff-filter=ACMR", since or "HEAD")
+    untracked = _git_paths(project_path, "ls-files", "--others", "--exclude-standard")
+    return sorted(set(changed) | set(untracked))
+
+
+def limit_to(project_path, paths: Iterable[str]):
+    """Restrict changed_only lookups under project_path to the given relative paths"""
+    _changed[str(Path(project_path).resolve())] = {PurePath(p).as_posix() for p in paths}
+
+
+def limits() -> Dict[str, Set[str]]:
+    """Every limit_to() recorded so far (project root -> relative paths), for worker processes"""
+    return {root: set(paths) for root, paths in _changed.items()}
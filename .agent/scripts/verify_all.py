@@ -8,6 +8,23 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --jobs 4
+    python scripts/verify_all.py . --url <URL> --since origin/main
+
+Categories marked "parallel" in VERIFICATION_SUITE are independent read-only
+scans; they run in worker threads (--jobs) alongside the sequential chain of
+the other categories; with --stop-on-fail a parallel category only starts once
+every required check before it has passed. The final report shows wall and CPU time per check and
+the critical path: working back from the check that finished last, the chain
+of checks that each waited for the one before it (by start and end times).
+Validators exposing a main(argv) entry point run in reusable worker
+processes (see check_runner.py); --isolate runs every check in its own
+subprocess.
+Per-file findings are cached under .agent/.cache/ (see findings_cache.py) so
+unchanged files are not re-analysed; --no-cache turns this off.
+--since <git-ref> / --staged limit file-level validators (security, UX,
+mobile, accessibility, SEO, GEO) to the files git reports as changed;
+project-level checks still run in full.
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -22,13 +39,19 @@ Includes ALL checks:
     ✅ Mobile Audit (if applicable)
 """
 
+import os
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+import findings_cache
+import project_files
+from check_runner import run_check
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -96,6 +119,7 @@ VERIFICATION_SUITE = [
     # P4: UX & Accessibility
     {
         "category": "UX & Accessibility",
+        "parallel": True,
         "checks": [
             ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False),
             ("Accessibility Check", ".agent/skills/frontend-design/scripts/accessibility_checker.py", False),
@@ -105,6 +129,7 @@ VERIFICATION_SUITE = [
     # P5: SEO & Content
     {
         "category": "SEO & Content",
+        "parallel": True,
         "checks": [
             ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
             ("GEO Check", ".agent/skills/geo-fundamentals/scripts/geo_checker.py", False),
@@ -133,6 +158,7 @@ VERIFICATION_SUITE = [
     # P8: Mobile (if applicable)
     {
         "category": "Mobile",
+        "parallel": True,
         "checks": [
             ("Mobile Audit", ".agent/skills/mobile-design/scripts/mobile_audit.py", False),
         ]
@@ -141,63 +167,131 @@ VERIFICATION_SUITE = [
     # P9: Internationalization
     {
         "category": "Internationalization",
+        "parallel": True,
         "checks": [
             ("i18n Check", ".agent/skills/i18n-localization/scripts/i18n_checker.py", False),
         ]
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+def execute_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+                   isolate: bool = False) -> dict:
+    """Run validation script without printing anything (in a worker process when it has a main(argv) entry point)"""
     if not script_path.exists():
-        print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
     
-    print_step(f"Running: {name}")
     start_time = datetime.now()
     
-    # Build command
-    cmd = ["python", str(script_path), project_path]
+    # Build arguments
+    args = [project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
+        args.append(url)
     
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        result = run_check(script_path, args, timeout=600, isolate=isolate, python="python")  # 10 minute timeout for slow checks
         
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+        end_time = datetime.now()
         
         return {
             "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "passed": result["returncode"] == 0,
+            "output": result["stdout"],
+            "error": result["stderr"],
             "skipped": False,
-            "duration": duration
+            "started": start_time,
+            "finished": end_time,
+            "duration": (end_time - start_time).total_seconds(),
+            "cpu": result["cpu"]
         }
     
     except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
+        end_time = datetime.now()
+        return {"name": name, "passed": False, "skipped": False, "started": start_time, "finished": end_time,
+                "duration": (end_time - start_time).total_seconds(), "error": "Timeout", "timeout": True}
     
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+        end_time = datetime.now()
+        return {"name": name, "passed": False, "skipped": False, "started": start_time, "finished": end_time,
+                "duration": (end_time - start_time).total_seconds(), "error": str(e), "exception": True}
+
+def print_result(result: dict):
+    """Print the status lines for a finished check"""
+    name = result["name"]
+    duration = result.get("duration", 0)
+    if result.get("skipped"):
+        print_warning(f"{name}: Script not found, skipping")
+    elif result.get("timeout"):
+        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
+    elif result.get("exception"):
+        print_error(f"{name}: ERROR - {result['error']}")
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({duration:.1f}s)")
+    else:
+        print_error(f"{name}: FAILED ({duration:.1f}s)")
+        if result.get("error"):
+            print(f"  {result['error'][:300]}")
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               isolate: bool = False) -> dict:
+    """Run validation script, printing its progress and status"""
+    if script_path.exists():
+        print_step(f"Running: {name}")
+    result = execute_script(name, script_path, project_path, url, isolate)
+    print_result(result)
+    return result
+
+def run_category_quietly(suite: dict, project_path: Path, url: Optional[str] = None,
+                         isolate: bool = False) -> List[dict]:
+    """Run a category's checks in order without printing (for parallel workers)"""
+    results = []
+    for name, script_path, _ in suite["checks"]:
+        result = execute_script(name, project_path / script_path, str(project_path), url, isolate)
+        result["category"] = suite["category"]
+        results.append(result)
+    return results
+
+def print_category(suite: dict, results: List[dict]):
+    """Print a finished category's buffered output as one group"""
+    print_header(f"📋 {suite['category'].upper()}")
+    for result in results:
+        if not result.get("skipped"):
+            print_step(f"Running: {result['name']}")
+        print_result(result)
+
+def collect_categories(suites: List[dict], futures: dict) -> List[dict]:
+    """Wait for the parallel categories in futures and print them, grouped and in suite order"""
+    results = []
+    for suite in suites:
+        future = futures.get(suite["category"])
+        if future is None:
+            continue
+        category_results = future.result()
+        for result in category_results:
+            result["parallel"] = True
+        print_category(suite, category_results)
+        results.extend(category_results)
+    return results
+
+def critical_path(results: List[dict]) -> List[dict]:
+    """
+    Chain of checks that bounded the total wall time, from their timestamps.
+
+    Starting at the check that finished last, each step goes back to the
+    check that finished most recently before the current one started - the
+    check it was waiting for, whether it followed it in a sequential category
+    or waited for a free --jobs worker.
+    """
+    timed = [r for r in results if not r.get("skipped") and r.get("started")]
+    if not timed:
+        return []
+    path = [max(timed, key=lambda r: r["finished"])]
+    while True:
+        before = [r for r in timed if r["finished"] <= path[-1]["started"]]
+        if not before:
+            break
+        path.append(max(before, key=lambda r: r["finished"]))
+    return path[::-1]
 
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
@@ -235,11 +329,23 @@ def print_final_report(results: List[dict], start_time: datetime):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
+        duration_str = ""
+        if not r.get("skipped"):
+            cpu = r.get("cpu")
+            cpu_str = f", {cpu:.1f}s cpu" if cpu is not None else ""
+            duration_str = f"({r.get('duration', 0):.1f}s wall{cpu_str})"
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
     
+    # Critical path: the sequence of checks that bounded the total wall time
+    path = critical_path(results)
+    if path:
+        path_duration = sum(r.get("duration", 0) for r in path)
+        print(f"{Colors.BOLD}Critical Path ({path_duration:.1f}s of {total_duration:.1f}s wall):{Colors.ENDC}")
+        print("  " + " → ".join(f"{r['name']} ({r.get('duration', 0):.1f}s)" for r in path))
+        print()
+    
     # Failed checks detail
     if failed > 0:
         print(f"{Colors.BOLD}{Colors.RED}❌ FAILED CHECKS:{Colors.ENDC}")
@@ -273,9 +379,16 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
-    parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--stop-on-fail", action="store_true", help="Stop when a required check fails (parallel categories after it are not started)")
+    parser.add_argument("--isolate", action="store_true", help="Run every check in its own subprocess instead of a reusable worker")
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyse every file instead of reusing cached findings")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--since", metavar="REF", help="Only audit files changed since a git ref (file-level checks)")
+    scope.add_argument("--staged", action="store_true", help="Only audit files staged for commit (file-level checks)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Parallel workers for independent categories (default: CPU count, 1 = sequential)")
     
     args = parser.parse_args()
+    findings_cache.ENABLED = not args.no_cache
     
     project_path = Path(args.project).resolve()
     
@@ -283,15 +396,31 @@ Examples:
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
     
+    changed = None
+    if args.since or args.staged:
+        try:
+            changed = project_files.git_changed_files(project_path, args.since, args.staged)
+        except (OSError, subprocess.CalledProcessError) as e:
+            detail = e.stderr.strip().splitlines()[0] if getattr(e, "stderr", None) else e
+            print_error(f"Could not list changed files: {detail}")
+            sys.exit(1)
+        project_files.limit_to(project_path, changed)
+    
     print_header("🚀 ANTIGRAVITY KIT - FULL VERIFICATION SUITE")
     print(f"Project: {project_path}")
     print(f"URL: {args.url}")
+    if changed is not None:
+        since = "staged for commit" if args.staged else f"changed since {args.since}"
+        print(f"Scope: {len(changed)} file(s) {since}")
+        if args.isolate:
+            print_warning("--isolate: file-level checks cannot be scoped and will scan the whole project")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
     results = []
     
-    # Run all verification categories
+    # Select verification categories
+    suites = []
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,19 +433,52 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
-        
-        for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
+        suites.append(suite)
+    
+    # Independent categories run in worker threads. Normally they all start
+    # right away; with --stop-on-fail each one starts only once the sequential
+    # chain reaches it, so a failed required check still stops everything after it
+    parallel = args.jobs > 1
+    pool = ThreadPoolExecutor(max_workers=args.jobs) if parallel else None
+    futures = {}
+    
+    def submit(suite):
+        futures[suite["category"]] = pool.submit(run_category_quietly, suite, project_path, args.url, args.isolate)
+    
+    if parallel and not args.stop_on_fail:
+        for suite in suites:
+            if suite.get("parallel"):
+                submit(suite)
+    
+    # The remaining categories run in order, printing as they go
+    try:
+        for suite in suites:
+            category = suite["category"]
+            if parallel and suite.get("parallel"):
+                if category not in futures:
+                    submit(suite)
+                continue
+            
+            print_header(f"📋 {category.upper()}")
             
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+            for name, script_path, required in suite["checks"]:
+                script = project_path / script_path
+                result = run_script(name, script, str(project_path), args.url, args.isolate)
+                result["category"] = category
+                results.append(result)
+                
+                # Stop on critical failure if flag set; parallel categories
+                # started so far come before the failed check and are reported
+                if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
+                    print_error(f"CRITICAL: {name} failed. Stopping verification.")
+                    results.extend(collect_categories(suites, futures))
+                    print_final_report(results, start_time)
+                    sys.exit(1)
+        
+        results.extend(collect_categories(suites, futures))
+    finally:
+        if pool:
+            pool.shutdown(wait=True)
     
     # Print final report
     all_passed = print_final_report(results, start_time)
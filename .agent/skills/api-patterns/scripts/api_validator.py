@@ -15,6 +15,12 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+# Shared file inventory, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+
 def find_api_files(project_path: Path) -> list:
     """Find API-related files."""
     patterns = [
@@ -27,9 +33,12 @@ def find_api_files(project_path: Path) -> list:
         "**/openapi.json", "**/openapi.yaml"
     ]
     
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    if project_files is not None:
+        files = project_files.match(project_path, patterns)
+    else:
+        files = []
+        for pattern in patterns:
+            files.extend(project_path.glob(pattern))
     
     # Exclude node_modules, etc.
     return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
@@ -40,7 +49,7 @@ def check_openapi_spec(file_path: Path) -> dict:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = project_files.read_text(file_path) if project_files else file_path.read_text(encoding='utf-8')
         
         if file_path.suffix == '.json':
             spec = json.loads(content)
@@ -97,7 +106,7 @@ def check_api_code(file_path: Path) -> dict:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = project_files.read_text(file_path) if project_files else file_path.read_text(encoding='utf-8')
         
         # Check for error handling
         error_patterns = [
@@ -159,8 +168,9 @@ def check_api_code(file_path: Path) -> dict:
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code'}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -25,18 +25,30 @@ try:
 except:
     pass
 
+# Shared file inventory, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+
 
 def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
     schemas = []
     
     # Prisma schema
-    prisma_files = list(project_path.glob('**/prisma/schema.prisma'))
+    if project_files is not None:
+        prisma_files = project_files.match(project_path, ['**/prisma/schema.prisma'])
+    else:
+        prisma_files = list(project_path.glob('**/prisma/schema.prisma'))
     schemas.extend([('prisma', f) for f in prisma_files])
     
     # Drizzle schema files
-    drizzle_files = list(project_path.glob('**/drizzle/*.ts'))
-    drizzle_files.extend(project_path.glob('**/schema/*.ts'))
+    if project_files is not None:
+        drizzle_files = project_files.match(project_path, ['**/drizzle/*.ts', '**/schema/*.ts'])
+    else:
+        drizzle_files = list(project_path.glob('**/drizzle/*.ts'))
+        drizzle_files.extend(project_path.glob('**/schema/*.ts'))
     for f in drizzle_files:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
@@ -49,7 +61,7 @@ def validate_prisma_schema(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = project_files.read_text(file_path, errors='ignore') if project_files else file_path.read_text(encoding='utf-8', errors='ignore')
         
         # Find all models
         models = re.findall(r'model\s+(\w+)\s*{([^}]+)}', content, re.DOTALL)
@@ -91,8 +103,9 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[SCHEMA VALIDATOR] Database Schema Validation")
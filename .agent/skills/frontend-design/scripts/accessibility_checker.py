@@ -26,17 +26,27 @@ try:
 except:
     pass
 
+# Shared file inventory, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
     patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
     
+    if project_files is not None:
+        candidates = project_files.glob(project_path, [p[4:] for p in patterns], changed_only=True)
+    else:
+        candidates = [f for pattern in patterns for f in project_path.glob(pattern)]
+    
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for f in candidates:
+        if not any(skip in f.parts for skip in skip_dirs):
+            files.append(f)
     
     return files[:50]
 
@@ -46,7 +56,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = project_files.read_text(file_path, errors='ignore') if project_files else file_path.read_text(encoding='utf-8', errors='ignore')
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,8 +118,9 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -95,17 +95,49 @@ import re
 import json
 from pathlib import Path
 
+# Shared file inventory and findings cache, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+try:
+    import findings_cache
+except ImportError:
+    findings_cache = None
+
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, cache=None):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        self.cache = cache  # findings_cache.FindingsCache, or None to audit every file
     
     def audit_file(self, filepath: str) -> None:
+        cached = self.cache.lookup(filepath) if self.cache else None
+        if cached is not None:
+            self.files_checked += 1
+            self.issues.extend(cached["issues"])
+            self.warnings.extend(cached["warnings"])
+            self.passed_count += cached["passed"]
+            return
+
+        start = (len(self.issues), len(self.warnings), self.passed_count, self.files_checked)
+        self._audit_file(filepath)
+        if self.cache and self.files_checked > start[3]:
+            self.cache.store(filepath, {
+                "issues": self.issues[start[0]:],
+                "warnings": self.warnings[start[1]:],
+                "passed": self.passed_count - start[2]
+            })
+
+    def _audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            if project_files is not None:
+                content = project_files.read_text(filepath, errors='replace')
+            else:
+                with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
         except: return
         
         self.files_checked += 1
@@ -673,8 +705,14 @@ class UXAuditor:
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+        skip_dirs = {'node_modules', '.git', 'dist', 'build', '.next'}
+        if project_files is not None:
+            for filepath in project_files.walk_files(directory, skip_dirs, changed_only=True):
+                if filepath.suffix in extensions:
+                    self.audit_file(str(filepath))
+            return
         for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
+            dirs[:] = [d for d in dirs if d not in skip_dirs]
             for file in files:
                 if Path(file).suffix in extensions:
                     self.audit_file(os.path.join(root, file))
@@ -688,15 +726,21 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
-def main():
-    if len(sys.argv) < 2: sys.exit(1)
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 1: sys.exit(1)
+    
+    path = argv[0]
+    is_json = "--json" in argv
     
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
+    cache = None
+    if findings_cache and not os.path.isfile(path):
+        cache = findings_cache.open_cache("ux_audit", __file__, path)
     
-    auditor = UXAuditor()
+    auditor = UXAuditor(cache)
     if os.path.isfile(path): auditor.audit_file(path)
     else: auditor.audit_directory(path)
+    if cache: cache.save()
     
     report = auditor.get_report()
     
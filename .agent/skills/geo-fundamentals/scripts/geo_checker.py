@@ -28,6 +28,12 @@ try:
 except AttributeError:
     pass
 
+# Shared file inventory, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+
 
 # Directories to skip (not public content)
 SKIP_DIRS = {
@@ -82,16 +88,20 @@ def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
+    if project_files is not None:
+        candidates = project_files.glob(project_path, [p[4:] for p in patterns], changed_only=True)
+    else:
+        candidates = [f for pattern in patterns for f in project_path.glob(pattern)]
+    
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    for f in candidates:
+        # Skip excluded directories
+        if any(skip in f.parts for skip in SKIP_DIRS):
+            continue
+        
+        # Check if it's likely a page
+        if is_page_file(f):
+            files.append(f)
     
     return files[:30]  # Limit to 30 pages
 
@@ -99,7 +109,7 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = project_files.read_text(file_path, errors='ignore') if project_files else file_path.read_text(encoding='utf-8', errors='ignore')
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
@@ -219,8 +229,9 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     target_path = Path(target).resolve()
     
     print("\n" + "=" * 60)
@@ -15,6 +15,12 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+# Shared file inventory, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+
 # Patterns that indicate hardcoded strings (should be translated)
 HARDCODED_PATTERNS = {
     'jsx': [
@@ -140,9 +146,12 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+    if project_files is not None:
+        code_files = project_files.glob(project_path, list(extensions))
+    else:
+        code_files = []
+        for ext in extensions:
+            code_files.extend(project_path.rglob(f"*{ext}"))
     
     code_files = [f for f in code_files if not any(x in str(f) for x in 
                   ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
@@ -156,7 +165,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = project_files.read_text(file_path, errors='ignore') if project_files else file_path.read_text(encoding='utf-8', errors='ignore')
             ext = file_path.suffix
             file_type = extensions.get(ext, 'jsx')
             
@@ -196,8 +205,9 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
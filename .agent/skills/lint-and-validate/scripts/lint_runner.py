@@ -101,8 +101,9 @@ def run_linter(linter: dict, cwd: Path) -> dict:
     return result
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[LINT RUNNER] Unified Linting")
@@ -15,13 +15,22 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+# Shared file inventory, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+
 def check_typescript_coverage(project_path: Path) -> dict:
     """Check TypeScript type coverage."""
     issues = []
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
+    if project_files is not None:
+        ts_files = project_files.glob(project_path, [".ts", ".tsx"])
+    else:
+        ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
     ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
     
     if not ts_files:
@@ -29,7 +38,7 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = project_files.read_text(file_path, errors='ignore') if project_files else file_path.read_text(encoding='utf-8', errors='ignore')
             
             # Count 'any' usage
             any_matches = re.findall(r':\s*any\b', content)
@@ -77,7 +86,10 @@ def check_python_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
+    if project_files is not None:
+        py_files = project_files.glob(project_path, [".py"])
+    else:
+        py_files = list(project_path.rglob("*.py"))
     py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
     
     if not py_files:
@@ -85,7 +97,7 @@ def check_python_coverage(project_path: Path) -> dict:
     
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = project_files.read_text(file_path, errors='ignore') if project_files else file_path.read_text(encoding='utf-8', errors='ignore')
             
             # Count Any usage
             any_matches = re.findall(r':\s*Any\b', content)
@@ -125,8 +137,9 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -29,6 +29,12 @@ try:
 except:
     pass
 
+# Shared file inventory, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+
 
 # Directories to skip
 SKIP_DIRS = {
@@ -79,16 +85,20 @@ def find_pages(project_path: Path) -> list:
     """Find page files to check."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
+    if project_files is not None:
+        candidates = project_files.glob(project_path, [p[4:] for p in patterns], changed_only=True)
+    else:
+        candidates = [f for pattern in patterns for f in project_path.glob(pattern)]
+    
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    for f in candidates:
+        # Skip excluded directories
+        if any(skip in f.parts for skip in SKIP_DIRS):
+            continue
+        
+        # Check if it's likely a page
+        if is_page_file(f):
+            files.append(f)
     
     return files[:50]  # Limit to 50 files
 
@@ -98,7 +108,7 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = project_files.read_text(file_path, errors='ignore') if project_files else file_path.read_text(encoding='utf-8', errors='ignore')
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
@@ -145,8 +155,9 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -137,9 +137,10 @@ def run_tests(cmd: list, cwd: Path) -> dict:
     return result
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    with_coverage = "--coverage" in sys.argv
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0] if argv else ".").resolve()
+    with_coverage = "--coverage" in argv
     
     print(f"\n{'='*60}")
     print(f"[TEST RUNNER] Unified Test Execution")
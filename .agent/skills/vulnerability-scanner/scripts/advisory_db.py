@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Skill: vulnerability-scanner
+Script: advisory_db.py
+Purpose: Offline advisory database for security_scan.py's dependency scan
+Usage: python advisory_db.py <snapshot> [--lookup ECOSYSTEM NAME VERSION]
+
+A snapshot is a set of OSV records (https://ossf.github.io/osv-schema/): a
+directory or .zip of per-advisory .json files (the layout of the OSV
+per-ecosystem exports), a .json file holding one record or a list of them, or
+a .jsonl file with one record per line. Nothing is fetched over the network.
+
+Affected ranges are indexed per (ecosystem, package): range boundaries are
+sorted once at load time, so resolving a dependency is one binary search.
+Versions compare by semver rules for npm and Go and by PEP 440 rules for PyPI.
+
+Lockfile readers stream package-lock.json (v1-v3), go.sum and pinned
+requirements.txt entries as (name, version) pairs.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import zipfile
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import go_modules
+
+# Ecosystem names as used in OSV records
+NPM = "npm"
+GO = "Go"
+PYPI = "PyPI"
+
+# GHSA-style severities mapped onto the scanner's levels
+SEVERITY_LEVELS = {"critical": "critical", "high": "high", "moderate": "medium", "medium": "medium", "low": "low"}
+DEFAULT_SEVERITY = "medium"
+
+
+# ============================================================================
+#  VERSION ORDERING
+# ============================================================================
+
+_RELEASE_RE = re.compile(r'^[vV]?(?:(\d+)!)?(\d+(?:\.\d+)*)(.*)$')
+_PEP440_SUFFIX_RE = re.compile(
+    r'^(?:[-_.]?(a|alpha|b|beta|c|rc|pre|preview)[-_.]?(\d*))?'
+    r'(?:-(\d+)|[-_.]?(post|rev|r)[-_.]?(\d*))?'
+    r'(?:[-_.]?(dev)[-_.]?(\d*))?$'
+)
+_PEP440_PRE_RANK = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+
+
+def version_key(ecosystem: str, version: str) -> Optional[tuple]:
+    """
+    Sort key for a version, or None if the string is not one (git URLs, tags,
+    local paths). Keys only compare with keys of the same ecosystem.
+    """
+    m = _RELEASE_RE.match(version.strip().split('+', 1)[0])
+    if not m:
+        return None
+    release = tuple(int(n) for n in m.group(2).split('.'))
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]  # 1.0 == 1.0.0
+    rest = m.group(3)
+
+    if ecosystem == PYPI:
+        suffix = _PEP440_SUFFIX_RE.match(rest.lower())
+        if not suffix:
+            return None
+        pre, pre_n, post_dash, post, post_n, dev, dev_n = suffix.groups()
+        is_post = post_dash is not None or post is not None
+        if pre:
+            pre_key = (1, _PEP440_PRE_RANK[pre], int(pre_n or 0))
+        elif dev and not is_post:
+            pre_key = (0,)  # 1.0.dev1 sorts before 1.0a1
+        else:
+            pre_key = (2,)
+        post_key = (1, int(post_dash or post_n or 0)) if is_post else (0,)
+        dev_key = (0, int(dev_n or 0)) if dev else (1,)
+        return (int(m.group(1) or 0), release, pre_key, post_key, dev_key)
+
+    # Semver (npm, Go): "-" starts a prerelease, which sorts before the release
+    if not rest:
+        return (release, (1,))
+    if not rest.startswith('-'):
+        return None
+    identifiers = tuple((0, int(p), '') if p.isdigit() else (1, 0, p) for p in rest[1:].split('.'))
+    return (release, (0,) + identifiers)
+
+
+def normalize_name(ecosystem: str, name: str) -> str:
+    """Package name as indexed: PEP 503 normalisation for PyPI, unchanged otherwise"""
+    if ecosystem == PYPI:
+        return re.sub(r'[-_.]+', '-', name).lower()
+    return name
+
+
+# ============================================================================
+#  DATABASE
+# ============================================================================
+
+class Advisory:
+    """One advisory as it applies to one package"""
+
+    __slots__ = ("id", "severity", "summary", "fixed")
+
+    def __init__(self, advisory_id: str, severity: str, summary: str, fixed: List[str]):
+        self.id = advisory_id
+        self.severity = severity
+        self.summary = summary
+        self.fixed = fixed   # versions that fix it, in range order
+
+
+def _severity(record: dict, affected: dict) -> str:
+    for source in (affected.get("ecosystem_specific"), affected.get("database_specific"),
+                   record.get("database_specific")):
+        if isinstance(source, dict) and isinstance(source.get("severity"), str):
+            return SEVERITY_LEVELS.get(source["severity"].lower(), DEFAULT_SEVERITY)
+    return DEFAULT_SEVERITY
+
+
+def _intervals(ecosystem: str, affected: dict) -> Iterator[Tuple[Optional[tuple], Optional[tuple]]]:
+    """
+    Affected version intervals as (start, end) boundaries: start inclusive,
+    end exclusive, None for unbounded. Boundaries are (version_key, 0) or,
+    for an inclusive end, (version_key, 1), which sorts just after it.
+    """
+    for version in affected.get("versions") or ():
+        key = version_key(ecosystem, version)
+        if key is not None:
+            yield (key, 0), (key, 1)
+
+    for rng in affected.get("ranges") or ():
+        if rng.get("type") not in ("SEMVER", "ECOSYSTEM"):
+            continue  # GIT ranges name commits, not versions
+        start, open_range = None, False
+        for event in rng.get("events") or ():
+            if "introduced" in event:
+                if event["introduced"] == "0":
+                    start, open_range = None, True
+                else:
+                    key = version_key(ecosystem, event["introduced"])
+                    start, open_range = (key, 0), key is not None
+            elif open_range and ("fixed" in event or "last_affected" in event or "limit" in event):
+                inclusive = "last_affected" in event
+                key = version_key(ecosystem, event.get("fixed") or event.get("last_affected") or event.get("limit"))
+                if key is not None:
+                    yield start, (key, 1 if inclusive else 0)
+                open_range = False
+        if open_range:
+            yield start, None
+
+
+class _PackageIndex:
+    """Affected intervals of one package, flattened into sorted boundaries"""
+
+    __slots__ = ("intervals", "boundaries", "covering")
+
+    def __init__(self):
+        self.intervals: List[Tuple[Optional[tuple], Optional[tuple], Advisory]] = []
+        self.boundaries: List[tuple] = []
+        self.covering: List[Tuple[Advisory, ...]] = []
+
+    def build(self):
+        """Split the version line at every boundary and record which advisories cover each segment"""
+        starts: Dict[tuple, List[int]] = {}
+        ends: Dict[tuple, List[int]] = {}
+        active = set()
+        for i, (start, end, _) in enumerate(self.intervals):
+            if start is not None and end is not None and end <= start:
+                continue
+            if start is None:
+                active.add(i)
+            else:
+                starts.setdefault(start, []).append(i)
+            if end is not None:
+                ends.setdefault(end, []).append(i)
+
+        # Sweep the boundaries in order; covering[k] holds for versions in
+        # [boundaries[k-1], boundaries[k])
+        self.boundaries = sorted(starts.keys() | ends.keys())
+        self.covering = [self._advisories(active)]
+        for boundary in self.boundaries:
+            active.difference_update(ends.get(boundary, ()))
+            active.update(starts.get(boundary, ()))
+            self.covering.append(self._advisories(active))
+        self.intervals = []
+
+    def _advisories(self, active) -> Tuple[Advisory, ...]:
+        advisories = {}
+        for i in sorted(active):
+            advisory = self.intervals[i][2]
+            advisories.setdefault(advisory.id, advisory)
+        return tuple(advisories.values())
+
+    def lookup(self, key: tuple) -> Tuple[Advisory, ...]:
+        return self.covering[bisect_right(self.boundaries, (key, 0))]
+
+
+class AdvisoryDatabase:
+    """Advisories indexed by (ecosystem, package name)"""
+
+    def __init__(self, records: Iterable[dict]):
+        self.advisories = 0
+        self._packages: Dict[Tuple[str, str], _PackageIndex] = {}
+        for record in records:
+            self._add(record)
+        for index in self._packages.values():
+            index.build()
+
+    def _add(self, record: dict):
+        if not isinstance(record, dict) or record.get("withdrawn"):
+            return
+        added = False
+        for affected in record.get("affected") or ():
+            package = affected.get("package") or {}
+            ecosystem, name = package.get("ecosystem"), package.get("name")
+            if not ecosystem or not name:
+                continue
+            ecosystem = ecosystem.split(':', 1)[0]  # "Debian:11" -> "Debian"
+            fixed = [event["fixed"] for rng in affected.get("ranges") or ()
+                     for event in rng.get("events") or () if "fixed" in event]
+            advisory = Advisory(record.get("id", "?"), _severity(record, affected),
+                                record.get("summary") or (record.get("details") or "")[:200], fixed)
+            index = self._packages.setdefault((ecosystem, normalize_name(ecosystem, name)), _PackageIndex())
+            for start, end in _intervals(ecosystem, affected):
+                index.intervals.append((start, end, advisory))
+                added = True
+        self.advisories += added
+
+    def __len__(self):
+        return self.advisories
+
+    @property
+    def packages(self) -> int:
+        return len(self._packages)
+
+    def lookup(self, ecosystem: str, name: str, version: str) -> Tuple[Advisory, ...]:
+        """Advisories affecting name@version (empty if none, or the version is unparseable)"""
+        index = self._packages.get((ecosystem, normalize_name(ecosystem, name)))
+        if index is None:
+            return ()
+        key = version_key(ecosystem, version)
+        if key is None:
+            return ()
+        return index.lookup(key)
+
+
+def _read_records(path: Path) -> Iterator[Any]:
+    """OSV records from a snapshot directory, .zip, .jsonl or .json file"""
+    if path.is_dir():
+        for file in sorted(path.rglob('*.json')):
+            with open(file, 'r', encoding='utf-8') as f:
+                yield json.load(f)
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for name in sorted(archive.namelist()):
+                if name.endswith('.json'):
+                    yield json.loads(archive.read(name))
+    elif path.suffix == '.jsonl':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        yield from data if isinstance(data, list) else [data]
+
+
+_databases: Dict[str, Tuple[int, int, AdvisoryDatabase]] = {}
+
+
+def load_database(path) -> AdvisoryDatabase:
+    """
+    Load a snapshot, once per process while it is unchanged.
+
+    Raises:
+        OSError if the snapshot cannot be read
+        ValueError if it is not valid JSON / zip
+    """
+    path = Path(path)
+    st = os.stat(path)
+    key = str(path.resolve())
+    cached = _databases.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        database = AdvisoryDatabase(_read_records(path))
+    except zipfile.BadZipFile as e:
+        raise ValueError(str(e)) from e
+    _databases[key] = (st.st_mtime_ns, st.st_size, database)
+    return database
+
+
+# ============================================================================
+#  LOCKFILE READERS
+# ============================================================================
+
+def read_package_lock(path) -> Iterator[Tuple[str, str]]:
+    """Installed packages from package-lock.json / npm-shrinkwrap.json"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    packages = data.get("packages")
+    if isinstance(packages, dict):
+        # lockfileVersion 2/3: keyed by install location
+        for location, meta in packages.items():
+            if "node_modules/" not in location or meta.get("link") or not meta.get("version"):
+                continue  # root project, workspace links
+            yield meta.get("name") or location.rsplit("node_modules/", 1)[1], meta["version"]
+        return
+
+    # lockfileVersion 1: nested "dependencies"
+    pending = [data.get("dependencies") or {}]
+    while pending:
+        for name, meta in pending.pop().items():
+            if meta.get("version"):
+                yield name, meta["version"]
+            if meta.get("dependencies"):
+                pending.append(meta["dependencies"])
+
+
+def read_go_sum(path) -> Iterator[Tuple[str, str]]:
+    """Module versions listed in go.sum, each once"""
+    for module, versions in go_modules.read_go_sum(path).items():
+        for version in versions:
+            yield module, version
+
+
+_REQUIREMENT_RE = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*===?\s*([^\s;,*]+)\s*(?:;.*)?$')
+
+
+def read_requirements(path) -> Iterator[Tuple[str, str]]:
+    """Exactly pinned requirements (name==version); ranges and options are skipped"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = re.sub(r'(^|\s)#.*', '', line).strip()
+            m = _REQUIREMENT_RE.match(line)
+            if m:
+                yield m.group(1), m.group(2)
+
+
+# Lockfile name -> (ecosystem, reader)
+LOCKFILES = {
+    "package-lock.json": (NPM, read_package_lock),
+    "npm-shrinkwrap.json": (NPM, read_package_lock),
+    "go.sum": (GO, read_go_sum),
+    "requirements.txt": (PYPI, read_requirements),
+}
+
+
+def resolve_lockfile(database: AdvisoryDatabase, path) -> Iterator[Tuple[str, str, Tuple[Advisory, ...]]]:
+    """
+    (name, version, advisories) for every entry of a lockfile, in file order;
+    an entry listed twice is resolved once.
+
+    Raises:
+        OSError / ValueError if the lockfile cannot be read or parsed
+    """
+    ecosystem, reader = LOCKFILES[Path(path).name]
+    seen = set()
+    for name, version in reader(path):
+        if (name, version) not in seen:
+            seen.add((name, version))
+            yield name, version, database.lookup(ecosystem, name, version)
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Inspect an offline advisory snapshot")
+    parser.add_argument("snapshot", help="OSV snapshot (directory, .zip, .json or .jsonl)")
+    parser.add_argument("--lookup", nargs=3, metavar=("ECOSYSTEM", "NAME", "VERSION"),
+                        help="Advisories affecting one package version")
+    args = parser.parse_args(argv)
+
+    try:
+        database = load_database(args.snapshot)
+    except (OSError, ValueError) as e:
+        print(json.dumps({"error": f"Cannot load {args.snapshot}: {e}"}))
+        sys.exit(1)
+
+    if args.lookup:
+        ecosystem, name, version = args.lookup
+        print(json.dumps([
+            {"id": a.id, "severity": a.severity, "summary": a.summary, "fixed": a.fixed}
+            for a in database.lookup(ecosystem, name, version)
+        ], indent=2))
+    else:
+        print(json.dumps({"advisories": len(database), "packages": database.packages}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Skill: vulnerability-scanner
+Script: benchmark_scan.py
+Purpose: Compare the previous secret and dangerous-pattern scans (one regex pass
+         per SECRET_PATTERNS entry, one re.search per line and pattern) against
+         security_scan.find_secrets() / find_dangerous_patterns(), and measure
+         what the high-entropy string check adds to the secret scan
+Usage: python benchmark_scan.py [project_path ...] [--files N] [--repeat N]
+       python benchmark_scan.py backend frontend
+
+Without a project path a synthetic tree of --files source files (a few of them
+holding secrets or dangerous calls) is generated in a temporary directory. File
+contents are read into memory first, so only scanning is timed. Old and new
+scanners must report identical findings.
+"""
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from security_scan import (
+    SECRET_PATTERNS, DANGEROUS_PATTERNS, CODE_EXTENSIONS, CONFIG_EXTENSIONS,
+    iter_project_files, read_file, find_secrets, find_dangerous_patterns, EntropyCheck
+)
+
+# Fix Windows console encoding for Unicode output
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass  # Python < 3.7
+
+SAMPLE_LINES = [
+    "const result = await fetch(url, { method: 'GET' });",
+    "def handle_request(request, response):",
+    "    return render(request, 'index.html', context)",
+    "import { useState, useEffect } from 'react';",
+    "export default function Page({ params }) {",
+    "    items = [item for item in items if item.enabled]",
+    "// TODO: move the retry logic into the client",
+    "    \"name\": \"example-package\", \"version\": \"1.0.0\",",
+]
+
+# Assembled at runtime so this file does not trigger the scanner it benchmarks
+SAMPLE_SECRETS = [
+    "api_key = 'sk_" + "live_" + "01234567" + "89abcdef'",
+    "pass" + "word: \"hunter2hunter2\"",
+    "DATABASE_URL = 'postgres" + "://user:pass@localhost/db'",
+    "aws_access_key_id = AKIA" + "ABCDEFGHIJKLMNOP",
+    "Authorization: Bear" + "er abc.def.ghi",
+    "    result = ev" + "al(user_input)",
+    "el.inner" + "HTML = html;",
+    "requests.get(url, verify=" + "False)",
+]
+
+
+def legacy_find_secrets(content: str) -> list:
+    """The previous scan: one re.findall() over the content per pattern"""
+    findings = []
+    for pattern, secret_type, severity in SECRET_PATTERNS:
+        matches = re.findall(pattern, content, re.IGNORECASE)
+        if matches:
+            findings.append({"type": secret_type, "severity": severity, "count": len(matches)})
+    return findings
+
+
+def legacy_find_dangerous_patterns(content: str) -> list:
+    """The previous scan: one re.search() per line and pattern"""
+    findings = []
+    for line_num, line in enumerate(content.split('\n'), 1):
+        for pattern, name, severity, category in DANGEROUS_PATTERNS:
+            if re.search(pattern, line, re.IGNORECASE):
+                findings.append({
+                    "line": line_num,
+                    "pattern": name,
+                    "severity": severity,
+                    "category": category,
+                    "snippet": line.strip()[:80]
+                })
+    return findings
+
+
+def generate_tree(root: Path, num_files: int):
+    """Write num_files synthetic source files under root, about 1 in 50 with a finding"""
+    rng = random.Random(42)
+    extensions = ['.js', '.ts', '.tsx', '.py', '.json']
+    for i in range(num_files):
+        directory = root / f"pkg{i % 40}" / f"mod{i % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        lines = [rng.choice(SAMPLE_LINES) for _ in range(rng.randint(50, 400))]
+        if i % 50 == 0:
+            lines.insert(rng.randrange(len(lines)), rng.choice(SAMPLE_SECRETS))
+        (directory / f"file{i}{rng.choice(extensions)}").write_text("\n".join(lines), encoding='utf-8')
+
+
+def load_contents(project_path: str, extensions: set) -> list:
+    """(relative path, content) for every file with one of the extensions"""
+    contents = []
+    for filepath in iter_project_files(project_path):
+        if filepath.suffix.lower() not in extensions:
+            continue
+        try:
+            contents.append((str(filepath.relative_to(project_path)), read_file(filepath)))
+        except Exception:
+            pass
+    return contents
+
+
+def time_scanner(scanner, contents: list, repeat: int):
+    """Best-of-repeat wall time and the findings of the last run"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        findings = [(path, scanner(content)) for path, content in contents]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, findings
+
+
+def benchmark_project(project_path: str, repeat: int) -> bool:
+    """Run every benchmark over one tree; False if old and new findings differ"""
+    benchmarks = [
+        ("Secrets", CODE_EXTENSIONS | CONFIG_EXTENSIONS, legacy_find_secrets, find_secrets),
+        ("Dangerous patterns", CODE_EXTENSIONS, legacy_find_dangerous_patterns, find_dangerous_patterns),
+    ]
+    corpora = [load_contents(project_path, extensions) for _, extensions, _, _ in benchmarks]
+
+    identical = True
+    for (title, _, old_scanner, new_scanner), contents in zip(benchmarks, corpora):
+        total_mb = sum(len(content) for _, content in contents) / 1e6
+        print(f"\n{title}: {len(contents)} files ({total_mb:.1f} MB of text)")
+
+        old_time, old_findings = time_scanner(old_scanner, contents, repeat)
+        new_time, new_findings = time_scanner(new_scanner, contents, repeat)
+        print(f"  Previous scan: {old_time:.3f}s")
+        print(f"  Current scan:  {new_time:.3f}s ({old_time / new_time:.1f}x)")
+
+        if old_findings == new_findings:
+            print(f"  Findings identical ({sum(len(f) for _, f in old_findings)} findings)")
+        else:
+            print("  [!!] Findings differ between scanners")
+            identical = False
+
+    # The entropy check runs inside find_secrets; its cost is the difference
+    contents = corpora[0]
+    total_mb = sum(len(content) for _, content in contents) / 1e6
+    check = EntropyCheck()
+    base_time, _ = time_scanner(find_secrets, contents, repeat)
+    entropy_time, findings = time_scanner(partial(find_secrets, entropy=check), contents, repeat)
+    strings = sum(f["count"] for path, file_findings in findings for f in file_findings
+                  if f["type"] == "High Entropy String" and not check.skips(path))
+    extra = max(entropy_time - base_time, 0.0)
+    print(f"\nEntropy check: {len(contents)} files ({total_mb:.1f} MB of text)")
+    print(f"  Secret scan without it: {base_time:.3f}s")
+    print(f"  Secret scan with it:    {entropy_time:.3f}s "
+          f"(+{extra:.3f}s, {extra / total_mb * 1000 if total_mb else 0:.1f} ms/MB)")
+    print(f"  High-entropy strings: {strings}")
+    return identical
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Benchmark secret and dangerous pattern scanning")
+    parser.add_argument("project_paths", nargs="*", metavar="project_path",
+                        help="Trees to scan, each benchmarked separately (default: generated tree)")
+    parser.add_argument("--files", type=int, default=2000, help="Files in the generated tree (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scanner, best time is reported (default: 3)")
+    args = parser.parse_args(argv)
+
+    identical = True
+    if args.project_paths:
+        for project_path in args.project_paths:
+            print(f"\n=== {project_path} ===")
+            identical = benchmark_project(project_path, args.repeat) and identical
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            generate_tree(Path(tmp), args.files)
+            identical = benchmark_project(tmp, args.repeat)
+
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
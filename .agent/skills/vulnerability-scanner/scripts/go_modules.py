@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Skill: vulnerability-scanner
+Script: go_modules.py
+Purpose: Go module analysis for security_scan.py's dependency scan
+
+read_go_sum() streams go.sum once into a module -> version -> hash kinds
+table; read_go_mod() parses the requirements and replacements of go.mod.
+analyze() cross-checks the two: required modules without a checksum, local
+replace directives and requirements pinned to untagged commits. Both tables
+are plain JSON data so security_scan can cache them by file hash.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+# go.sum hash line kinds
+ZIP = "zip"        # module@version h1:...        (module contents)
+GO_MOD = "go.mod"  # module@version/go.mod h1:... (its go.mod only)
+
+# vX.Y.Z-[pre.]yyyymmddhhmmss-abcdefabcdef
+_PSEUDO_VERSION_RE = re.compile(r'(^|[-.])\d{14}-[0-9a-f]{12}$')
+
+
+def read_go_sum(path) -> Dict[str, Dict[str, List[str]]]:
+    """module -> version -> hash kinds present, in go.sum order"""
+    table: Dict[str, Dict[str, List[str]]] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) != 3:
+                continue
+            module, version = parts[0], parts[1]
+            kind = ZIP
+            if version.endswith('/go.mod'):
+                version, kind = version[:-len('/go.mod')], GO_MOD
+            kinds = table.setdefault(module, {}).setdefault(version, [])
+            if kind not in kinds:
+                kinds.append(kind)
+    return table
+
+
+def _fields(line: str) -> List[str]:
+    return [field.strip('"') for field in line.split('//', 1)[0].split()]
+
+
+def read_go_mod(path) -> Dict[str, Any]:
+    """
+    The parts of go.mod the scan needs:
+    {"module", "go", "require": [[path, version, indirect]],
+     "replace": [[old, old_version or "", new, new_version or ""]]}
+    """
+    info: Dict[str, Any] = {"module": "", "go": "", "require": [], "replace": []}
+    block = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            if block is not None:
+                if stripped.startswith(')'):
+                    block = None
+                    continue
+                directive, fields = block, _fields(stripped)
+            else:
+                fields = _fields(stripped)
+                if not fields:
+                    continue
+                directive, fields = fields[0], fields[1:]
+                if fields == ['(']:
+                    block = directive
+                    continue
+
+            if not fields:
+                continue
+            if directive == "module":
+                info["module"] = fields[0]
+            elif directive == "go":
+                info["go"] = fields[0]
+            elif directive == "require" and len(fields) >= 2:
+                info["require"].append([fields[0], fields[1], "// indirect" in line])
+            elif directive == "replace" and "=>" in fields:
+                arrow = fields.index("=>")
+                old, new = fields[:arrow], fields[arrow + 1:]
+                if old and new:
+                    info["replace"].append([old[0], old[1] if len(old) > 1 else "",
+                                            new[0], new[1] if len(new) > 1 else ""])
+    return info
+
+
+def is_local_path(target: str) -> bool:
+    """replace targets starting with ./ ../ or / are directories, not modules"""
+    return target.startswith(('./', '../', '/', '.\\', '..\\')) or target in ('.', '..')
+
+
+def analyze(go_mod: Dict[str, Any], go_sum: Optional[Dict[str, Dict[str, List[str]]]], rel_path: str) -> List[dict]:
+    """Findings for one module; go_sum is None when the module has no go.sum"""
+    findings = []
+    if go_sum is None:
+        if go_mod["require"]:
+            findings.append({
+                "type": "Missing Lock File",
+                "severity": "high",
+                "file": rel_path,
+                "message": "go: No go.sum found. Supply chain integrity at risk."
+            })
+        return findings
+
+    replaced = {}
+    for old, old_version, new, new_version in go_mod["replace"]:
+        replaced[(old, old_version)] = (new, new_version)
+        if is_local_path(new):
+            findings.append({
+                "type": "Local Replace",
+                "severity": "medium",
+                "file": rel_path,
+                "package": old + (f"@{old_version}" if old_version else ""),
+                "message": f"Replaced by local directory {new}; builds use unversioned, unverified code"
+            })
+
+    pseudo = []
+    for module, version, _ in go_mod["require"]:
+        target = replaced.get((module, version)) or replaced.get((module, ""))
+        if target is not None:
+            if is_local_path(target[0]):
+                continue
+            module, version = target[0], target[1] or version
+        if version not in go_sum.get(module, {}):
+            findings.append({
+                "type": "Missing Checksum",
+                "severity": "medium",
+                "file": rel_path,
+                "package": f"{module}@{version}",
+                "message": "Required module has no go.sum entry; go.sum is out of date"
+            })
+        if _PSEUDO_VERSION_RE.search(version):
+            pseudo.append(f"{module}@{version}")
+
+    if pseudo:
+        findings.append({
+            "type": "Unreleased Version",
+            "severity": "low",
+            "file": rel_path,
+            "message": f"{len(pseudo)} module(s) pinned to untagged commits: {', '.join(pseudo)}"
+        })
+    return findings
@@ -3,11 +3,11 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--output json|jsonl|summary]
 Output: JSON with validation findings
 
 This script verifies:
-1. Dependencies - Supply chain security (OWASP A03)
+1. Dependencies - Supply chain security (OWASP A03); offline with --advisory-db
 2. Secrets - No hardcoded credentials (OWASP A04)
 3. Code Patterns - Dangerous patterns identified (OWASP A05)
 4. Configuration - Security settings validated (OWASP A02)
@@ -18,8 +18,17 @@ import os
 import sys
 import re
 import argparse
+import fnmatch
+import tempfile
+import time
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+from math import log2
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 
 # Fix Windows console encoding for Unicode output
@@ -29,6 +38,19 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+import advisory_db
+import go_modules
+
+# Shared file inventory and findings cache, importable when run from checklist.py / verify_all.py
+try:
+    import project_files
+except ImportError:
+    project_files = None
+try:
+    import findings_cache
+except ImportError:
+    findings_cache = None
+
 
 # ============================================================================
 #  CONFIGURATION
@@ -58,6 +80,27 @@ SECRET_PATTERNS = [
     (r'eyJ[A-Za-z0-9-_]+\.eyJ[A-Za-z0-9-_]+\.[A-Za-z0-9-_]+', "JWT Token", "high"),
 ]
 
+# Literal (lowercase) that every match of a secret pattern contains, one per
+# SECRET_PATTERNS entry in the same order. find_secrets() only runs a pattern
+# when its anchor occurs in the file, which is one cheap substring search
+# instead of a full regex pass for the usual no-secret file. The anchor tables
+# are lists rather than dicts keyed by pattern name, and some literals are split
+# in two, so that this file does not match its own patterns.
+SECRET_ANCHORS = [
+    "api",
+    "token",
+    "bearer",
+    "akia",
+    "aws",
+    "azure",
+    "google",
+    "password",
+    "://",
+    "-----begin",
+    "ssh-rsa",
+    "eyj",
+]
+
 DANGEROUS_PATTERNS = [
     # Injection risks
     (r'eval\s*\(', "eval() usage", "critical", "Code Injection risk"),
@@ -85,25 +128,534 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
-SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
+# Literals (lowercase) of which every match of a dangerous pattern contains at
+# least one, one tuple per DANGEROUS_PATTERNS entry in the same order;
+# find_dangerous_patterns() skips patterns whose anchors are absent.
+DANGEROUS_ANCHORS = [
+    ("eval",),
+    ("exec",),
+    ("function",),
+    ("child_process.exec",),
+    ("subprocess.call",),
+    ("dangerously" + "setinnerhtml",),
+    (".innerhtml",),
+    ("document.write",),
+    ("select", "insert", "update", "delete"),
+    ("select", "insert", "update", "delete"),
+    ("verify",),
+    ("--" + "insecure",),
+    ("disable",),
+    ("pickle.load",),
+    ("yaml.load",),
+]
+
+# Regexes checked in configuration files: (pattern, issue, severity)
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next', '.cache'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
+NPM_LOCK_FILES = ["package-lock.json", "npm-shrinkwrap.json"]
+NPM_AUDIT_TIMEOUT = 60
+
+# High-entropy strings: candidate tokens of ENTROPY_MIN_LENGTH..ENTROPY_MAX_LENGTH
+# characters (longer runs are embedded data, not credentials) whose Shannon
+# entropy is at least the threshold, in bits per character
+ENTROPY_THRESHOLD = 4.0
+ENTROPY_MIN_LENGTH = 20
+ENTROPY_MAX_LENGTH = 256
+ENTROPY_SKIP_FILES = {'package-lock.json', 'npm-shrinkwrap.json', 'go.sum', 'Pipfile.lock', 'composer.lock'}
+
+# Project file listing strings the entropy check should not report: one regex
+# per line (matched against the whole token), or "path:<glob>" for files
+ALLOWLIST_FILE = ".secrets-allowlist"
+
+# File triage for the file scanners. Files whose first SNIFF_BYTES hold a NUL
+# byte are binary; larger files whose sniffed lines average
+# MINIFIED_LINE_LENGTH characters or more (or named *.min.*) are minified
+# bundles. Neither is scanned. Files over MAX_FILE_SIZE (--max-size) are not
+# read whole but in CHUNK_SIZE pieces that overlap by CHUNK_OVERLAP characters.
+SNIFF_BYTES = 8192
+MINIFIED_LINE_LENGTH = 500
+MAX_FILE_SIZE = 1024 * 1024
+CHUNK_SIZE = 256 * 1024
+CHUNK_OVERLAP = 4096
+
+# Offline advisory snapshot (see advisory_db.py) used when --advisory-db is not given
+ADVISORY_DB_ENV = "SECURITY_ADVISORY_DB"
+
+
+def iter_project_files(project_path: str, changed_only: bool = True):
+    """Yield every file outside SKIP_DIRS, from the shared inventory when available
+    (limited to changed files in incremental mode unless changed_only is False)"""
+    if project_files is not None:
+        yield from project_files.walk_files(project_path, SKIP_DIRS, changed_only=changed_only)
+        return
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for file in files:
+            yield Path(root) / file
+
+
+def read_file(filepath: Path) -> str:
+    """Read a file as UTF-8, ignoring undecodable bytes"""
+    if project_files is not None:
+        return project_files.read_text(filepath, errors='ignore')
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+_SECRET_REGEXES = [
+    (re.compile(pattern, re.IGNORECASE), secret_type, severity, SECRET_ANCHORS[i])
+    for i, (pattern, secret_type, severity) in enumerate(SECRET_PATTERNS)
+]
+
+# Non-ASCII characters that re.IGNORECASE matches to an ASCII letter but that
+# str.lower() does not turn into it (KELVIN SIGN already lowercases to 'k')
+_CASE_EQUIVALENTS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
+
+def _fold_case(content: str) -> str:
+    """Lowercased content in which an anchor is found wherever re.IGNORECASE would match it"""
+    if not content.isascii() and any(chr(c) in content for c in _CASE_EQUIVALENTS):
+        content = content.translate(_CASE_EQUIVALENTS)
+    return content.lower()
+
+
+class EntropyCheck:
+    """Settings of the high-entropy string detector (picklable for --jobs workers)"""
+
+    __slots__ = ("threshold", "allow", "skip_paths")
+
+    def __init__(self, threshold: float = ENTROPY_THRESHOLD, allow: Tuple[str, ...] = (),
+                 skip_paths: Tuple[str, ...] = ()):
+        self.threshold = threshold
+        self.allow = re.compile('|'.join(f'(?:{p})' for p in allow)) if allow else None
+        self.skip_paths = skip_paths
+
+    def settings(self) -> dict:
+        """What the cached findings depend on (path globs are applied afterwards)"""
+        return {"threshold": self.threshold, "allow": self.allow.pattern if self.allow else None}
+
+    def skips(self, rel_path: str) -> bool:
+        """Whether entropy findings in this file are not reported"""
+        return Path(rel_path).name in ENTROPY_SKIP_FILES or \
+            any(fnmatch.fnmatch(rel_path, glob) for glob in self.skip_paths)
+
+
+def load_entropy_check(project_path: str, threshold: float = ENTROPY_THRESHOLD,
+                       allowlist: Optional[str] = None) -> EntropyCheck:
+    """EntropyCheck with the allowlist file (default: ALLOWLIST_FILE in the project, if present)"""
+    path = Path(allowlist) if allowlist else Path(project_path) / ALLOWLIST_FILE
+    allow, skip_paths = [], []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                if line.startswith('path:'):
+                    skip_paths.append(line[len('path:'):].strip())
+                    continue
+                try:
+                    re.compile(line)
+                except re.error:
+                    line = re.escape(line)
+                allow.append(line)
+    except OSError:
+        if allowlist:
+            raise
+    return EntropyCheck(threshold, tuple(allow), tuple(skip_paths))
+
+
+# One pass pulls out runs of base64/base64url/hex characters; '/' and '.'
+# split tokens so paths and dotted names do not form candidates. A run longer
+# than ENTROPY_MAX_LENGTH matches once (truncated) and is then skipped whole.
+_TOKEN_RE = re.compile(r'(?<![A-Za-z0-9+=_\-])[A-Za-z0-9+=_\-]{%d,%d}' % (ENTROPY_MIN_LENGTH, ENTROPY_MAX_LENGTH + 1))
+_DIGITS = frozenset('0123456789')
+
+# c * log2(c) for every count a token can hold
+_C_LOG2_C = [0.0] + [c * log2(c) for c in range(1, ENTROPY_MAX_LENGTH + 1)]
+
+
+def shannon_entropy(token: str) -> float:
+    """Shannon entropy of a token in bits per character: log2(n) - sum(c*log2(c))/n"""
+    n = len(token)
+    return log2(n) - sum(_C_LOG2_C[c] for c in Counter(token).values()) / n
+
+
+def find_high_entropy_strings(content: str, check: EntropyCheck) -> List[int]:
+    """Line numbers (one per token) of high-entropy tokens in content"""
+    lines = []
+    min_distinct = 2 ** check.threshold
+    line, counted_to = 1, 0
+    for m in _TOKEN_RE.finditer(content):
+        token = m.group()
+        # Cheap rejections first: blobs, tokens without both letters and
+        # digits, and tokens with too few distinct characters to reach the
+        # threshold (entropy <= log2(distinct characters))
+        if len(token) > ENTROPY_MAX_LENGTH or token.isalpha() or _DIGITS.isdisjoint(token):
+            continue
+        if len(set(token)) < min_distinct:
+            continue
+        if shannon_entropy(token) < check.threshold:
+            continue
+        if check.allow is not None and check.allow.fullmatch(token):
+            continue
+        line += content.count('\n', counted_to, m.start())
+        counted_to = m.start()
+        lines.append(line)
+    return lines
+
+
+def find_secrets(content: str, entropy: Optional[EntropyCheck] = None) -> List[Dict[str, Any]]:
+    """Secret findings (type, severity, count) for one file's content"""
+    folded = _fold_case(content)
+    findings = []
+    for regex, secret_type, severity, anchor in _SECRET_REGEXES:
+        if anchor is not None and anchor not in folded:
+            continue
+        matches = regex.findall(content)
+        if matches:
+            findings.append({
+                "type": secret_type,
+                "severity": severity,
+                "count": len(matches)
+            })
+    
+    if entropy is not None:
+        lines = find_high_entropy_strings(content, entropy)
+        if lines:
+            findings.append({
+                "type": "High Entropy String",
+                "severity": "medium",
+                "count": len(lines),
+                "lines": lines
+            })
+    return findings
+
+
+def _line_confined(pattern: str) -> str:
+    """
+    Rewrite a per-line pattern so that a match over the whole buffer cannot
+    cross a newline: whitespace escapes and negated classes stop matching
+    newlines ('.' already does). Assumes no whitespace escape inside a class.
+    """
+    return pattern.replace('[^', '[^\\n').replace(r'\s', r'[^\S\n]')
+
+
+_DANGEROUS_REGEXES = [
+    (re.compile(_line_confined(pattern), re.IGNORECASE), name, severity, category, DANGEROUS_ANCHORS[i])
+    for i, (pattern, name, severity, category) in enumerate(DANGEROUS_PATTERNS)
+]
+_NEWLINE = re.compile('\n')
+
+
+def find_dangerous_patterns(content: str) -> List[Dict[str, Any]]:
+    """
+    Dangerous pattern findings (line, pattern, severity, category, snippet) for
+    one file's content: at most one per (line, pattern), ordered by line and
+    then by DANGEROUS_PATTERNS order.
+    
+    Each pattern whose anchors occur in the file runs once over the whole
+    buffer; match offsets are mapped to line numbers through a table of line
+    start offsets.
+    """
+    folded = _fold_case(content)
+    hits = []
+    for index, (regex, _, _, _, anchors) in enumerate(_DANGEROUS_REGEXES):
+        if anchors is not None and not any(anchor in folded for anchor in anchors):
+            continue
+        hits.extend((match.start(), index) for match in regex.finditer(content))
+    if not hits:
+        return []
+    
+    line_starts = [0]
+    line_starts.extend(match.end() for match in _NEWLINE.finditer(content))
+    line_hits = sorted({(bisect_right(line_starts, offset), index) for offset, index in hits})
+    
+    findings = []
+    for line_num, index in line_hits:
+        start = line_starts[line_num - 1]
+        end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(content)
+        _, name, severity, category, _ = _DANGEROUS_REGEXES[index]
+        findings.append({
+            "line": line_num,
+            "pattern": name,
+            "severity": severity,
+            "category": category,
+            "snippet": content[start:end].strip()[:80]
+        })
+    return findings
+
+
+def find_config_issues(content: str) -> List[Dict[str, Any]]:
+    """Configuration findings (issue, severity) for one config file's content"""
+    findings = []
+    for pattern, issue, severity in CONFIG_ISSUES:
+        if re.search(pattern, content, re.IGNORECASE):
+            findings.append({
+                "issue": issue,
+                "severity": severity
+            })
+    return findings
+
+
+# Files per task sent to a worker process; small enough to balance the load,
+# large enough that pickling overhead stays negligible
+SHARD_SIZE = 64
+
+
+def classify_file(name: str, head: bytes, size: int) -> Optional[str]:
+    """"binary" or "minified" from a file's first SNIFF_BYTES, None for a file worth scanning"""
+    if b'\0' in head:
+        return "binary"
+    if '.min.' in name:
+        return "minified"
+    if size > SNIFF_BYTES and len(head) / (head.count(b'\n') + 1) >= MINIFIED_LINE_LENGTH:
+        return "minified"
+    return None
+
+
+def _scan_chunks(finder: Callable[[str], list], f) -> list:
+    """
+    finder() over an open text file in CHUNK_SIZE pieces cut at line ends.
+    Each piece is preceded by the whole lines in the last CHUNK_OVERLAP
+    characters of the one before, so a match across a cut is still found.
+    Findings on those overlap lines, counted matches lying in the overlap
+    alone and repeated presence findings are dropped, so the merged findings
+    match a whole-file scan (in first-seen order).
+    """
+    located: List[dict] = []       # findings with a "line", in file order
+    merged: Dict[tuple, dict] = {}  # "lines" / "count" / presence findings
+    prefix, base_line = "", 0      # base_line: newlines before prefix + chunk
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        if not chunk.endswith('\n'):
+            chunk += f.readline(CHUNK_SIZE)
+        text = prefix + chunk
+        prefix_lines = prefix.count('\n')
+        
+        overlap_counts = {}
+        if prefix:
+            for finding in finder(prefix):
+                if "count" in finding and "lines" not in finding:
+                    overlap_counts[(finding["type"], finding["severity"])] = finding["count"]
+        
+        occurrences = {}
+        for finding in finder(text):
+            if "line" in finding:
+                if finding["line"] > prefix_lines:
+                    located.append({**finding, "line": finding["line"] + base_line})
+            elif "lines" in finding:
+                lines = [line + base_line for line in finding["lines"] if line > prefix_lines]
+                if lines:
+                    entry = merged.setdefault(("lines", finding["type"], finding["severity"]),
+                                              {**finding, "count": 0, "lines": []})
+                    entry["lines"].extend(lines)
+                    entry["count"] = len(entry["lines"])
+            elif "count" in finding:
+                count = finding["count"] - overlap_counts.get((finding["type"], finding["severity"]), 0)
+                if count > 0:
+                    entry = merged.setdefault(("count", finding["type"], finding["severity"]),
+                                              {**finding, "count": 0})
+                    entry["count"] += count
+            else:
+                key = tuple(sorted(finding.items()))
+                occurrences[key] = occurrences.get(key, 0) + 1
+                merged.setdefault(("presence", key, occurrences[key]), finding)
+        
+        # Carry the whole lines of the last CHUNK_OVERLAP characters over
+        boundary = text.rfind('\n', 0, len(text) - CHUNK_OVERLAP) if len(text) > CHUNK_OVERLAP else -1
+        prefix = text[boundary + 1:] if boundary >= 0 and text.endswith('\n') else ""
+        base_line += text.count('\n') - prefix.count('\n')
+    
+    return located + list(merged.values())
+
+
+def _find_in_file(finder: Callable[[str], list], filepath: Path, max_size: int):
+    """finder() over one file, or {"skipped": reason} for binary and minified files"""
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    reason = classify_file(filepath.name, head, size)
+    if reason:
+        return {"skipped": reason}
+    if size <= max_size:
+        return finder(read_file(filepath))
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        return _scan_chunks(finder, f)
+
+
+def _find_in_files(finder: Callable[[str], list], filepaths: List[Path], max_size: int) -> List[Any]:
+    """_find_in_file() over each file; None for files that cannot be read"""
+    results = []
+    for filepath in filepaths:
+        try:
+            results.append(_find_in_file(finder, filepath, max_size))
+        except Exception:
+            results.append(None)
+    return results
+
+
+def scan_files(filepaths: List[Path], finder: Callable[[str], list], cache=None,
+               executor: Optional[Executor] = None,
+               skipped: Optional[Dict[str, int]] = None,
+               max_size: int = MAX_FILE_SIZE) -> Iterator[Tuple[Path, list]]:
+    """
+    Yield (filepath, findings) for each readable file, in filepaths order.
+    Binary and minified files are left out and counted by reason in skipped;
+    files over max_size bytes are scanned in chunks.
+    
+    Cached files are taken from the findings cache. The rest are scanned here,
+    or in shards of SHARD_SIZE files on the executor (a process pool) when one
+    is given; results are merged back in file order, so the output does not
+    depend on how the work was split.
+    """
+    cached = [cache.lookup(filepath) if cache else None for filepath in filepaths]
+    pending = [filepath for filepath, findings in zip(filepaths, cached) if findings is None]
+    
+    scanned = None
+    if executor is not None and len(pending) > SHARD_SIZE:
+        shards = [pending[i:i + SHARD_SIZE] for i in range(0, len(pending), SHARD_SIZE)]
+        try:
+            scanned = [findings for shard in executor.map(_find_in_files, repeat(finder), shards, repeat(max_size))
+                       for findings in shard]
+        except Exception:
+            scanned = None  # Workers unavailable (e.g. module not importable in the child); scan here
+    if scanned is None:
+        scanned = (findings for filepath in pending for findings in _find_in_files(finder, [filepath], max_size))
+    
+    fresh = iter(zip(pending, scanned))
+    for filepath, findings in zip(filepaths, cached):
+        if findings is None:
+            _, findings = next(fresh)
+            if findings is None:
+                continue
+            if cache:
+                cache.store(filepath, findings)
+        if isinstance(findings, dict):
+            if skipped is not None:
+                skipped[findings["skipped"]] = skipped.get(findings["skipped"], 0) + 1
+            continue
+        yield filepath, findings
+    
+    if cache:
+        cache.save()
+
+
+def _collector(results: Dict[str, Any], on_finding: Optional[Callable[[dict], None]]) -> Callable[[dict], None]:
+    """Where a scanner puts its findings: on_finding when streaming, else results["findings"]"""
+    return on_finding if on_finding is not None else results["findings"].append
+
+
+# ============================================================================
+#  DEPENDENCY AUDIT
+# ============================================================================
+
+class NpmAudit:
+    """
+    `npm audit --json` for one project, started as a background process so it
+    overlaps the file scans. The parsed severity counts are cached against the
+    npm lock file's hash; while the lock file is unchanged npm is not run.
+    """
+
+    def __init__(self, project_path: str):
+        self.project_path = project_path
+        self.counts: Optional[Dict[str, int]] = None
+        self._cache = None
+        self._proc = None
+        self._lock_file = next((Path(project_path) / f for f in NPM_LOCK_FILES
+                                if (Path(project_path) / f).exists()), None)
+        
+        if findings_cache and self._lock_file:
+            self._cache = findings_cache.open_cache("security_scan.npm_audit", __file__, project_path)
+            if self._cache:
+                self.counts = self._cache.lookup(self._lock_file)
+        if self.counts is None:
+            # Output goes to a file, not a pipe, so npm never blocks on a full buffer
+            self._output = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+            try:
+                self._proc = subprocess.Popen(
+                    ["npm", "audit", "--json"],
+                    cwd=project_path,
+                    stdout=self._output,
+                    stderr=subprocess.DEVNULL
+                )
+                self._started = time.monotonic()
+            except FileNotFoundError:
+                self._output.close()
+
+    def result(self) -> Optional[Dict[str, int]]:
+        """Severity counts (waiting for npm if needed), or None if the audit could not run"""
+        if self._proc is None:
+            return self.counts
+        proc, self._proc = self._proc, None
+        
+        try:
+            proc.wait(timeout=max(0, NPM_AUDIT_TIMEOUT - (time.monotonic() - self._started)))
+            self._output.seek(0)
+            audit_data = json.load(self._output)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return None
+        except json.JSONDecodeError:
+            return None
+        finally:
+            self._output.close()
+        
+        # A failed audit (offline, registry error) prints {"error": ...} and no
+        # report; it must not be cached as a clean result. npm also exits
+        # non-zero when it does find vulnerabilities, so a non-zero exit only
+        # counts as a failure without a report.
+        if not isinstance(audit_data, dict) or "error" in audit_data:
+            return None
+        vulnerabilities = audit_data.get("vulnerabilities")
+        if not isinstance(vulnerabilities, dict) or (proc.returncode != 0 and not vulnerabilities):
+            return None
+        
+        severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
+        for vuln in vulnerabilities.values():
+            sev = vuln.get("severity", "low").lower()
+            if sev in severity_count:
+                severity_count[sev] += 1
+        
+        self.counts = severity_count
+        if self._cache:
+            self._cache.store(self._lock_file, severity_count)
+            self._cache.save()
+        return severity_count
+
 
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
-def scan_dependencies(project_path: str) -> Dict[str, Any]:
+def scan_dependencies(project_path: str, audit: Optional[NpmAudit] = None,
+                      advisory_snapshot: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
-    Checks: npm audit, lock file presence, dependency age.
+    Checks: npm audit, lock file presence, Go modules, dependency age.
+    Pass an NpmAudit started earlier to collect its result instead of auditing now.
+    With an advisory_snapshot, every locked dependency is resolved against it
+    offline and npm audit is not run.
     """
     results = {"tool": "dependency_scanner", "findings": [], "status": "[OK] Secure"}
     
     # Check for lock files
     lock_files = {
-        "npm": ["package-lock.json", "npm-shrinkwrap.json"],
+        "npm": NPM_LOCK_FILES,
         "yarn": ["yarn.lock"],
         "pnpm": ["pnpm-lock.yaml"],
         "pip": ["requirements.txt", "Pipfile.lock", "poetry.lock"],
@@ -128,49 +680,39 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
                     "message": f"{manager}: No lock file found. Supply chain integrity at risk."
                 })
     
+    # Go modules live anywhere in the tree (e.g. backend/go.mod)
+    go_stats = scan_go_modules(project_path, results["findings"])
+    if go_stats:
+        results["go_modules"] = go_stats
+    
+    if advisory_snapshot:
+        results["advisory_db"] = scan_advisories(project_path, advisory_snapshot, results["findings"])
+        severities = {f["severity"] for f in results["findings"] if f["type"] == "Known Vulnerability"}
+        if "critical" in severities:
+            results["status"] = "[!!] Critical vulnerabilities"
+        elif "high" in severities:
+            results["status"] = "[!] High vulnerabilities"
+    
     # Run npm audit if applicable
-    if (Path(project_path) / "package.json").exists():
-        try:
-            result = subprocess.run(
-                ["npm", "audit", "--json"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+    elif (Path(project_path) / "package.json").exists():
+        severity_count = (audit or NpmAudit(project_path)).result()
+        if severity_count is not None:
+            if severity_count["critical"] > 0:
+                results["status"] = "[!!] Critical vulnerabilities"
+                results["findings"].append({
+                    "type": "npm audit",
+                    "severity": "critical",
+                    "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
+                })
+            elif severity_count["high"] > 0:
+                results["status"] = "[!] High vulnerabilities"
+                results["findings"].append({
+                    "type": "npm audit",
+                    "severity": "high",
+                    "message": f"{severity_count['high']} high severity vulnerabilities"
+                })
             
-            try:
-                audit_data = json.loads(result.stdout)
-                vulnerabilities = audit_data.get("vulnerabilities", {})
-                
-                severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
-                for vuln in vulnerabilities.values():
-                    sev = vuln.get("severity", "low").lower()
-                    if sev in severity_count:
-                        severity_count[sev] += 1
-                
-                if severity_count["critical"] > 0:
-                    results["status"] = "[!!] Critical vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "critical",
-                        "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
-                    })
-                elif severity_count["high"] > 0:
-                    results["status"] = "[!] High vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "high",
-                        "message": f"{severity_count['high']} high severity vulnerabilities"
-                    })
-                
-                results["npm_audit"] = severity_count
-                
-            except json.JSONDecodeError:
-                pass
-                
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+            results["npm_audit"] = severity_count
     
     if not results["findings"]:
         results["status"] = "[OK] Supply chain checks passed"
@@ -178,47 +720,123 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def scan_go_modules(project_path: str, findings: List[dict]) -> List[dict]:
+    """
+    Analyse every go.mod in the project with its go.sum (see go_modules.py),
+    appending findings. Parsed go.mod/go.sum tables are cached by file hash,
+    so an unchanged module is not re-read. Returns one summary per module.
+    """
+    go_mod_files = sorted(f for f in iter_project_files(project_path, changed_only=False) if f.name == "go.mod")
+    if not go_mod_files:
+        return []
+    # The cached tables are go_modules' parse results, so its source is part of the version
+    cache = (findings_cache.open_cache("security_scan.go_modules", __file__, project_path,
+                                       settings=findings_cache.source_version(go_modules.__file__))
+             if findings_cache else None)
+    
+    def load(path, reader):
+        table = cache.lookup(path) if cache else None
+        if table is None:
+            table = reader(path)
+            if cache:
+                cache.store(path, table)
+        return table
+    
+    stats = []
+    for go_mod_file in go_mod_files:
+        rel_path = str(go_mod_file.relative_to(project_path))
+        go_sum_file = go_mod_file.with_name("go.sum")
+        try:
+            go_mod = load(go_mod_file, go_modules.read_go_mod)
+            go_sum = load(go_sum_file, go_modules.read_go_sum) if go_sum_file.exists() else None
+        except (OSError, ValueError):
+            continue  # Unreadable module files
+        findings.extend(go_modules.analyze(go_mod, go_sum, rel_path))
+        stats.append({
+            "file": rel_path,
+            "module": go_mod["module"],
+            "go": go_mod["go"],
+            "requires": len(go_mod["require"]),
+            "go_sum_versions": sum(len(versions) for versions in go_sum.values()) if go_sum is not None else 0
+        })
+    
+    if cache:
+        cache.save()
+    return stats
+
+
+def scan_advisories(project_path: str, snapshot: str, findings: List[dict]) -> Dict[str, Any]:
+    """
+    Resolve every entry of every lockfile in the project (package-lock.json,
+    go.sum, requirements.txt) against an offline advisory snapshot, appending
+    one finding per vulnerable dependency and advisory. Returns the statistics.
+    """
+    try:
+        database = advisory_db.load_database(snapshot)
+    except (OSError, ValueError) as e:
+        return {"snapshot": snapshot, "error": f"Cannot load advisory snapshot: {e}"}
+    
+    stats = {"snapshot": snapshot, "advisories": len(database), "lockfiles": 0, "dependencies": 0}
+    lockfiles = sorted(f for f in iter_project_files(project_path, changed_only=False)
+                       if f.name in advisory_db.LOCKFILES)
+    for lockfile in lockfiles:
+        rel_path = str(lockfile.relative_to(project_path))
+        try:
+            for name, version, advisories in advisory_db.resolve_lockfile(database, lockfile):
+                stats["dependencies"] += 1
+                for advisory in advisories:
+                    fixed = f" (fixed in {', '.join(advisory.fixed)})" if advisory.fixed else ""
+                    findings.append({
+                        "type": "Known Vulnerability",
+                        "severity": advisory.severity,
+                        "file": rel_path,
+                        "package": f"{name}@{version}",
+                        "advisory": advisory.id,
+                        "message": f"{advisory.summary}{fixed}"
+                    })
+        except (OSError, ValueError, AttributeError):
+            continue  # Unreadable or malformed lockfile
+        stats["lockfiles"] += 1
+    
+    return stats
+
+
+def scan_secrets(project_path: str, executor: Optional[Executor] = None,
+                 on_finding: Optional[Callable[[dict], None]] = None,
+                 entropy: Optional[EntropyCheck] = None, max_size: int = MAX_FILE_SIZE) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
-    Checks: API keys, tokens, passwords, cloud credentials.
+    Checks: API keys, tokens, passwords, cloud credentials, and with an
+    EntropyCheck, high-entropy strings.
+    Findings go to on_finding as they are found if given, else into "findings".
     """
     results = {
         "tool": "secret_scanner",
         "findings": [],
         "status": "[OK] No secrets detected",
         "scanned_files": 0,
+        "skipped_files": {},
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
+    settings = entropy.settings() if entropy else None
+    cache = findings_cache.open_cache("security_scan.secrets", __file__, project_path, settings) if findings_cache else None
+    finder = partial(find_secrets, entropy=entropy) if entropy else find_secrets
+    
+    filepaths = [
+        filepath for filepath in iter_project_files(project_path)
+        if filepath.suffix.lower() in CODE_EXTENSIONS or filepath.suffix.lower() in CONFIG_EXTENSIONS
+    ]
+    results["scanned_files"] = len(filepaths)
+    record = _collector(results, on_finding)
+    
+    for filepath, file_findings in scan_files(filepaths, finder, cache, executor, results["skipped_files"], max_size):
+        rel_path = str(filepath.relative_to(project_path))
+        for finding in file_findings:
+            if finding["type"] == "High Entropy String" and entropy.skips(rel_path):
                 continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
+            record({"file": rel_path, **finding})
+            results["by_severity"][finding["severity"]] += finding["count"]
     
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
@@ -227,118 +845,88 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     elif sum(results["by_severity"].values()) > 0:
         results["status"] = "[?] Potential secrets detected"
     
-    # Limit findings for output
-    results["findings"] = results["findings"][:15]
-    
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str, executor: Optional[Executor] = None,
+                       on_finding: Optional[Callable[[dict], None]] = None,
+                       max_size: int = MAX_FILE_SIZE) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
+    Findings go to on_finding as they are found if given, else into "findings".
     """
     results = {
         "tool": "pattern_scanner",
         "findings": [],
         "status": "[OK] No dangerous patterns",
         "scanned_files": 0,
+        "skipped_files": {},
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
-    critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
-    high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
+    cache = findings_cache.open_cache("security_scan.patterns", __file__, project_path) if findings_cache else None
+    
+    filepaths = [filepath for filepath in iter_project_files(project_path) if filepath.suffix.lower() in CODE_EXTENSIONS]
+    results["scanned_files"] = len(filepaths)
+    record = _collector(results, on_finding)
+    by_severity = {}
+    
+    for filepath, file_findings in scan_files(filepaths, find_dangerous_patterns, cache, executor,
+                                              results["skipped_files"], max_size):
+        for finding in file_findings:
+            record({"file": str(filepath.relative_to(project_path)), **finding})
+            category = finding["category"]
+            results["by_category"][category] = results["by_category"].get(category, 0) + 1
+            by_severity[finding["severity"]] = by_severity.get(finding["severity"], 0) + 1
+    
+    critical_count = by_severity.get("critical", 0)
+    high_count = by_severity.get("high", 0)
     
     if critical_count > 0:
         results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
     elif high_count > 0:
         results["status"] = f"[!] HIGH: {high_count} risky patterns"
-    elif results["findings"]:
+    elif by_severity:
         results["status"] = "[?] Some patterns need review"
     
-    # Limit findings
-    results["findings"] = results["findings"][:20]
-    
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_configuration(project_path: str, executor: Optional[Executor] = None,
+                       on_finding: Optional[Callable[[dict], None]] = None,
+                       max_size: int = MAX_FILE_SIZE) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
+    Findings go to on_finding as they are found if given, else into "findings".
     """
     results = {
         "tool": "config_scanner",
         "findings": [],
         "status": "[OK] Configuration secure",
+        "skipped_files": {},
         "checks": {}
     }
     
     # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+    filepaths = [
+        filepath for filepath in iter_project_files(project_path)
+        if filepath.suffix.lower() in CONFIG_EXTENSIONS
+        or filepath.name in ['next.config.js', 'webpack.config.js', '.eslintrc.js']
     ]
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
+    collect = _collector(results, on_finding)
+    severities = set()
+    
+    def record(finding):
+        severities.add(finding["severity"])
+        collect(finding)
+    
+    for filepath, file_findings in scan_files(filepaths, find_config_issues, executor=executor,
+                                              skipped=results["skipped_files"], max_size=max_size):
+        for finding in file_findings:
+            record({"file": str(filepath.relative_to(project_path)), **finding})
     
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
@@ -349,17 +937,17 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
             break
     else:
         results["checks"]["security_headers_config"] = False
-        results["findings"].append({
+        record({
             "issue": "No security headers configuration found",
             "severity": "medium",
             "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
         })
     
-    if any(f["severity"] == "critical" for f in results["findings"]):
+    if "critical" in severities:
         results["status"] = "[!!] CRITICAL: Configuration issues"
-    elif any(f["severity"] == "high" for f in results["findings"]):
+    elif "high" in severities:
         results["status"] = "[!] HIGH: Configuration review needed"
-    elif results["findings"]:
+    elif severities:
         results["status"] = "[?] Minor configuration issues"
     
     return results
@@ -369,8 +957,19 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", jobs: int = 1,
+                  on_finding: Optional[Callable[[str, dict], None]] = None,
+                  advisory_snapshot: Optional[str] = None,
+                  entropy: Optional[EntropyCheck] = None,
+                  max_size: int = MAX_FILE_SIZE) -> Dict[str, Any]:
+    """
+    Execute security validation scans (file scanners use `jobs` worker processes).
+    advisory_snapshot is passed on to scan_dependencies, entropy to scan_secrets,
+    max_size (largest file read whole) to the file scanners.
+    
+    With on_finding, every finding is passed to on_finding(scan_name, finding)
+    as soon as it is found and the report's "findings" lists stay empty.
+    """
     
     report = {
         "project": project_path,
@@ -386,26 +985,50 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     }
     
     scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+        "deps": ("dependencies", scan_dependencies, False),
+        "secrets": ("secrets", partial(scan_secrets, entropy=entropy), True),
+        "patterns": ("code_patterns", scan_code_patterns, True),
+        "config": ("configuration", scan_configuration, True),
     }
     
-    for key, (name, scanner) in scanners.items():
-        if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
-            report["scans"][name] = result
-            
-            findings_count = len(result.get("findings", []))
-            report["summary"]["total_findings"] += findings_count
-            
-            for finding in result.get("findings", []):
+    selected = [key for key in scanners if scan_type == "all" or scan_type == key]
+    report["scans"] = dict.fromkeys(scanners[key][0] for key in selected)
+    
+    # npm audit runs in the background while the file scanners work; the
+    # dependency scan collects it last
+    audit = None
+    if "deps" in selected and not advisory_snapshot and (Path(project_path) / "package.json").exists():
+        audit = NpmAudit(project_path)
+        selected.append(selected.pop(selected.index("deps")))
+    
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        for key in selected:
+            name, scanner, scans_files = scanners[key]
+            def record(finding, name=name):
+                report["summary"]["total_findings"] += 1
                 sev = finding.get("severity", "low")
                 if sev == "critical":
                     report["summary"]["critical"] += 1
                 elif sev == "high":
                     report["summary"]["high"] += 1
+                if on_finding is not None:
+                    on_finding(name, finding)
+            
+            if scans_files:
+                result = scanner(project_path, executor, record if on_finding is not None else None,
+                                 max_size=max_size)
+            else:
+                result = scanner(project_path, audit, advisory_snapshot)
+            if on_finding is None or not scans_files:
+                for finding in result.get("findings", []):
+                    record(finding)
+                if on_finding is not None:
+                    result["findings"] = []
+            report["scans"][name] = result
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     # Determine overall status
     if report["summary"]["critical"] > 0:
@@ -418,23 +1041,55 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
-def main():
+def main(argv: list = None):
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
     )
     parser.add_argument("project_path", nargs="?", default=".", help="Project directory to scan")
     parser.add_argument("--scan-type", choices=["all", "deps", "secrets", "patterns", "config"],
                         default="all", help="Type of scan to run")
-    parser.add_argument("--output", choices=["json", "summary"], default="json",
-                        help="Output format")
+    parser.add_argument("--output", choices=["json", "jsonl", "summary"], default="json",
+                        help="Output format (jsonl: one finding per line as found, then a summary record)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for the file scanners (default: 1)")
+    parser.add_argument("--max-size", type=int, default=MAX_FILE_SIZE, metavar="BYTES",
+                        help=f"Largest file read whole; bigger files are scanned in chunks (default: {MAX_FILE_SIZE})")
+    parser.add_argument("--entropy-threshold", type=float, default=ENTROPY_THRESHOLD, metavar="BITS",
+                        help=f"Report strings with at least this Shannon entropy per character; 0 disables "
+                             f"(default: {ENTROPY_THRESHOLD})")
+    parser.add_argument("--allowlist", metavar="FILE",
+                        help=f"Strings/paths the entropy check ignores (default: <project>/{ALLOWLIST_FILE})")
+    parser.add_argument("--advisory-db", default=os.environ.get(ADVISORY_DB_ENV), metavar="SNAPSHOT",
+                        help=f"Offline OSV advisory snapshot to check lockfiles against instead of npm audit "
+                             f"(default: ${ADVISORY_DB_ENV})")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not os.path.isdir(args.project_path):
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    entropy = None
+    if args.entropy_threshold > 0:
+        try:
+            entropy = load_entropy_check(args.project_path, args.entropy_threshold, args.allowlist)
+        except OSError as e:
+            print(json.dumps({"error": f"Cannot read allowlist: {e}"}))
+            sys.exit(1)
+    
+    if args.output == "jsonl":
+        def emit(scan_name, finding):
+            print(json.dumps({"record": "finding", "scan": scan_name, **finding}), flush=True)
+        
+        result = run_full_scan(args.project_path, args.scan_type, args.jobs, emit, args.advisory_db, entropy,
+                               args.max_size)
+        for scan_result in result["scans"].values():
+            scan_result.pop("findings", None)
+        print(json.dumps({"record": "summary", **result}), flush=True)
+        return
+    
+    result = run_full_scan(args.project_path, args.scan_type, args.jobs,
+                           advisory_snapshot=args.advisory_db, entropy=entropy, max_size=args.max_size)
     
     if args.output == "summary":
         print(f"\n{'='*60}")